@@ -8,13 +8,55 @@ sin librerías externas.
 Invocación: python convert_numbers.py archivo_con_datos.txt
 """
 
+import math
 import os
 import sys
 import time
+from array import array
 
 # Dígitos hexadecimales para conversión (0-15 mapeados a caracteres)
 HEX_DIGITS = "0123456789ABCDEF"
 
+# Tablas de decodificación: carácter hexadecimal -> valor y nibble binario -> valor
+HEX_VALUES = {char: value for value, char in enumerate(HEX_DIGITS)}
+HEX_VALUES.update({char.lower(): value for value, char in enumerate(HEX_DIGITS)})
+BIN_NIBBLE_VALUES = {
+    format(value, "04b"): value for value in range(16)
+}
+
+# Tablas de formateo por byte para buffers empaquetados (byte -> 8 bits)
+BYTE_BIN = tuple(format(value, "08b") for value in range(256))
+
+# Formatos de array para patrones IEEE-754 por ancho en bits
+IEEE754_TYPECODES = {32: 'f', 64: 'd'}
+
+# Magnitud a partir de la cual un float redondea a infinito en 32 bits (el
+# mayor finito más media unidad en el último lugar)
+FLOAT32_OVERFLOW = 2.0 ** 128 - 2.0 ** 103
+
+# Celdas de error de Excel: dato inválido y valor fuera de rango
+ERROR_CELLS = ("#VALUE!", "#NUM!")
+
+# Rango de los arreglos tipados 'q' (enteros con signo de 64 bits)
+INT64_MIN = -(1 << 63)
+INT64_MAX = (1 << 63) - 1
+
+
+def _twos_complement(number):
+    """
+    Aplica el complemento a dos alineado a nibble a un entero negativo.
+
+    Usa el mínimo múltiplo de 4 bits cuya potencia de 2 supera abs(number).
+    Los enteros no negativos se regresan sin cambio.
+    """
+    if number >= 0:
+        return number
+    abs_val = -number
+    bits = 4
+    while (1 << bits) <= abs_val:
+        bits += 4  # Usar alineación de nibble
+    return (1 << bits) + number
+
 
 def to_binary(number):
     """
@@ -32,13 +74,7 @@ def to_binary(number):
         return "0"
 
     # Para números negativos: usar complemento a dos
-    if number < 0:
-        # Encontrar bits mínimos necesarios: siguiente potencia de 2 mayor a abs(num)
-        abs_val = abs(number)
-        bits = 4
-        while (1 << bits) <= abs_val:
-            bits += 4  # Usar alineación de nibble
-        number = (1 << bits) + number
+    number = _twos_complement(number)
 
     binary_chars = []
     n = number
@@ -68,12 +104,7 @@ def to_hexadecimal(number):
         return "0"
 
     # Para números negativos: usar complemento a dos (igual que binario)
-    if number < 0:
-        abs_val = abs(number)
-        bits = 4
-        while (1 << bits) <= abs_val:
-            bits += 4
-        number = (1 << bits) + number
+    number = _twos_complement(number)
 
     hex_chars = []
     n = number
@@ -86,18 +117,258 @@ def to_hexadecimal(number):
     return ''.join(reversed(hex_chars))
 
 
-def read_numeric_data(file_path):
+def format_packed_batch(buffer, record_size):
+    """
+    Formatea un buffer big-endian de registros de ancho fijo a BIN y HEX.
+
+    Convierte el buffer completo de una vez (tabla por byte para binario,
+    bytes.hex para hexadecimal) y luego lo corta por registro, conservando
+    los ceros a la izquierda.
+
+    Args:
+        buffer: bytes con los registros empaquetados en orden big-endian.
+        record_size: Tamaño de cada registro en bytes.
+
+    Returns:
+        Tupla (lista de cadenas binarias, lista de cadenas hexadecimales).
+    """
+    bin_all = ''.join(map(BYTE_BIN.__getitem__, buffer))
+    hex_all = buffer.hex().upper()
+    bin_width = 8 * record_size
+    hex_width = 2 * record_size
+    count = len(buffer) // record_size
+    binaries = [bin_all[i * bin_width:(i + 1) * bin_width] for i in range(count)]
+    hexes = [hex_all[i * hex_width:(i + 1) * hex_width] for i in range(count)]
+    return binaries, hexes
+
+
+def _pack_ieee754(floats, bits):
+    """Empaqueta floats como IEEE-754 de 32 o 64 bits en orden big-endian."""
+    packed = array(IEEE754_TYPECODES[bits], floats)
+    if sys.byteorder == "little":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def ieee754_bit_patterns(floats, bits=64):
+    """
+    Obtiene el patrón de bits IEEE-754 de cada flotante en lote.
+
+    Args:
+        floats: Secuencia de float (p. ej. array('d')).
+        bits: 32 (precisión simple) o 64 (precisión doble).
+
+    Returns:
+        Tupla (lista de cadenas binarias, lista de cadenas hexadecimales)
+        de ancho fijo (bits dígitos binarios, bits/4 hexadecimales).
+    """
+    return format_packed_batch(_pack_ieee754(floats, bits), bits // 8)
+
+
+def ieee754_overflows(number, bits):
+    """True si number es finito pero su patrón de bits sería infinito."""
+    return bits == 32 and FLOAT32_OVERFLOW <= abs(number) < math.inf
+
+
+def verify_ieee754(number, bits, binary_str, hex_str):
+    """
+    Verifica que BIN y HEX decodifiquen al patrón IEEE-754 de number.
+
+    Compara bytes en lugar de flotantes para que NaN y -0.0 también cuenten.
+    Un valor que desborda a infinito nunca se considera verificado.
+    """
+    if ieee754_overflows(number, bits):
+        return False
+    expected = _pack_ieee754((number,), bits)
+    size = bits // 8
+    bin_value = from_binary(binary_str)
+    hex_value = from_hexadecimal(hex_str)
+    if bin_value is None or hex_value is None:
+        return False
+    return (bin_value.to_bytes(size, "big") == expected
+            and hex_value.to_bytes(size, "big") == expected)
+
+
+def _apply_sign(value, bits, signed):
+    """Interpreta value como complemento a dos de bits si signed y el bit alto está activo."""
+    if signed and bits and value >> (bits - 1):
+        return value - (1 << bits)
+    return value
+
+
+def from_binary(text, signed=False):
+    """
+    Convierte cadena binaria a entero con decodificación por tabla.
+
+    Procesa la cadena en bloques de 4 dígitos (nibbles) usando BIN_NIBBLE_VALUES.
+
+    Args:
+        text: Cadena binaria (ej., "1010").
+        signed: Si es True, interpreta la cadena como complemento a dos con
+            ancho alineado a nibble (el bit alto del nibble inicial es el signo).
+            La conversión directa elimina ceros a la izquierda, así que un
+            negativo cuyo bit alto quedó en cero (ej., -9 -> "111") se lee
+            como positivo.
+
+    Returns:
+        Entero decodificado, o None si la cadena no es binaria válida.
+    """
+    if not text:
+        return None
+    # Rellenar a la izquierda para alinear a nibble
+    head = len(text) % 4
+    if head:
+        text = "0" * (4 - head) + text
+    value = 0
+    table = BIN_NIBBLE_VALUES
+    for start in range(0, len(text), 4):
+        nibble = table.get(text[start:start + 4])
+        if nibble is None:
+            return None
+        value = (value << 4) | nibble
+    return _apply_sign(value, len(text), signed)
+
+
+def from_hexadecimal(text, signed=False):
+    """
+    Convierte cadena hexadecimal a entero con decodificación por tabla.
+
+    Args:
+        text: Cadena hexadecimal (ej., "1A2F"); acepta minúsculas.
+        signed: Si es True, interpreta la cadena como complemento a dos de
+            4 bits por dígito (mismas reservas que from_binary).
+
+    Returns:
+        Entero decodificado, o None si la cadena no es hexadecimal válida.
+    """
+    if not text:
+        return None
+    value = 0
+    table = HEX_VALUES
+    for char in text:
+        digit = table.get(char)
+        if digit is None:
+            return None
+        value = (value << 4) | digit
+    return _apply_sign(value, 4 * len(text), signed)
+
+
+def verify_round_trip(number, binary_str, hex_str):
+    """
+    Verifica que las cadenas BIN y HEX decodifiquen de vuelta a number.
+
+    Compara contra el valor sin signo que produce la convención de
+    complemento a dos alineado a nibble, por lo que también valida negativos.
+
+    Returns:
+        True si ambas representaciones coinciden con number.
+    """
+    expected = _twos_complement(number)
+    return (from_binary(binary_str) == expected
+            and from_hexadecimal(hex_str) == expected)
+
+
+class NumericData:
+    """
+    Almacenamiento compacto de los datos leídos de un archivo.
+
+    Las líneas válidas se guardan en arreglos tipados paralelos (número de
+    línea y valor, 8 bytes cada uno). Solo las líneas inválidas conservan
+    su texto original, en una tabla dispersa indexada por número de línea.
+    Los enteros que no caben en 64 bits también van a una tabla dispersa.
+    Los flotantes (modo IEEE-754) se guardan en su propio arreglo 'd' y una
+    columna de un byte por fila marca su posición; ambos se crean al leer
+    el primer flotante.
+    """
+
+    __slots__ = ("line_numbers", "values", "invalid", "wide", "floats", "is_float")
+
+    def __init__(self):
+        """Inicializa arreglos vacíos y tablas dispersas."""
+        self.line_numbers = array('q')
+        self.values = array('q')
+        # número_línea -> texto original (solo líneas inválidas)
+        self.invalid = {}
+        # número_línea -> entero fuera del rango de 64 bits
+        self.wide = {}
+        # Flotantes en orden de aparición y marca por fila (None si no hay)
+        self.floats = None
+        self.is_float = None
+
+    def append_value(self, line_number, number):
+        """Agrega un número válido leído en la línea indicada."""
+        self.line_numbers.append(line_number)
+        if INT64_MIN <= number <= INT64_MAX:
+            self.values.append(number)
+        else:
+            self.values.append(0)
+            self.wide[line_number] = number
+        if self.is_float is not None:
+            self.is_float.append(0)
+
+    def append_float(self, line_number, number):
+        """Agrega un flotante que se convertirá a su patrón IEEE-754."""
+        if self.is_float is None:
+            self.floats = array('d')
+            self.is_float = bytearray(len(self.line_numbers))
+        self.line_numbers.append(line_number)
+        self.values.append(0)
+        self.floats.append(number)
+        self.is_float.append(1)
+
+    def append_invalid(self, line_number, original):
+        """Agrega una línea inválida conservando su texto original."""
+        self.line_numbers.append(line_number)
+        self.values.append(0)
+        self.invalid[line_number] = original
+        if self.is_float is not None:
+            self.is_float.append(0)
+
+    def __len__(self):
+        return len(self.line_numbers)
+
+    def __iter__(self):
+        """
+        Itera en orden de línea.
+
+        Yields:
+            Tuplas (número_línea, número o None, línea_original o None).
+            El texto original solo se entrega para líneas inválidas.
+        """
+        invalid = self.invalid
+        wide = self.wide
+        if not invalid and not wide and self.is_float is None:
+            for line_number, number in zip(self.line_numbers, self.values):
+                yield (line_number, number, None)
+            return
+        is_float = self.is_float or bytes(len(self.line_numbers))
+        float_index = 0
+        for row, (line_number, number) in enumerate(zip(self.line_numbers, self.values)):
+            if is_float[row]:
+                yield (line_number, self.floats[float_index], None)
+                float_index += 1
+            elif line_number in invalid:
+                yield (line_number, None, invalid[line_number])
+            elif line_number in wide:
+                yield (line_number, wide[line_number], None)
+            else:
+                yield (line_number, number, None)
+
+
+def read_numeric_data(file_path, keep_floats=False):
     """
     Lee datos numéricos de un archivo, manejando entradas inválidas.
 
     Args:
         file_path: Ruta al archivo con datos numéricos (uno por línea).
+        keep_floats: Si es True, los valores no enteros se conservan como
+            float (para IEEE-754) en lugar de truncarse a int.
 
     Returns:
-        Lista de tuplas (número_línea, número o None, línea_original).
-        Las líneas inválidas tienen None como número.
+        NumericData iterable como tuplas (número_línea, número o None,
+        línea_original o None). Las líneas inválidas tienen None como número.
     """
-    data = []
+    data = NumericData()
     line_number = 0
 
     try:
@@ -110,6 +381,9 @@ def read_numeric_data(file_path):
                     continue
 
                 try:
+                    if keep_floats:
+                        _append_number_or_float(data, line_number, stripped_line)
+                        continue
                     # Verificar si es número decimal
                     if '.' in stripped_line:
                         num = float(stripped_line)
@@ -117,9 +391,9 @@ def read_numeric_data(file_path):
                         num = int(num)
                     else:
                         num = int(stripped_line)
-                    data.append((line_number, num, stripped_line))
-                except ValueError:
-                    data.append((line_number, None, stripped_line))
+                    data.append_value(line_number, num)
+                except (ValueError, OverflowError):
+                    data.append_invalid(line_number, stripped_line)
 
     except FileNotFoundError:
         print(f"Error: Archivo '{file_path}' no encontrado.")
@@ -131,6 +405,87 @@ def read_numeric_data(file_path):
     return data
 
 
+def _append_number_or_float(data, line_number, text):
+    """Agrega text como int si es entero; si no, como float (modo IEEE-754)."""
+    try:
+        data.append_value(line_number, int(text))
+    except ValueError:
+        data.append_float(line_number, float(text))
+
+
+def read_converted_data(file_path):
+    """
+    Lee un archivo con columnas BIN/HEX (formato de ConvertionResults.txt).
+
+    Cada encabezado "ITEM\t<TC>\tBIN\tHEX" inicia una sección; las líneas
+    vacías, VERIFIED y TIME ELAPSED se ignoran. Si no hay encabezado, cada
+    línea se trata como un valor binario suelto (volcado de una columna).
+
+    Args:
+        file_path: Ruta al archivo con resultados de conversión.
+
+    Yields:
+        Tuplas (nombre_sección, item, decimal_original, bin, hex); las columnas
+        ausentes se entregan como None.
+    """
+    section = _get_tc_name(file_path)
+    columns = None
+
+    try:
+        with open(file_path, 'r', encoding='utf-8') as file:
+            for line in file:
+                fields = line.rstrip('\r\n').split('\t')
+                if not fields[0] or fields[0] in ("TIME ELAPSED", "VERIFIED"):
+                    continue
+                if fields[0] == "ITEM":
+                    section = fields[1] if len(fields) > 1 else section
+                    columns = {name: pos for pos, name in enumerate(fields)}
+                    continue
+                if columns is None:
+                    # Volcado sin encabezado: un valor por línea
+                    yield (section, None, None, fields[0].strip(), None)
+                    continue
+                yield (
+                    section,
+                    fields[0],
+                    fields[1] if len(fields) > 1 else None,
+                    _field(fields, columns.get("BIN")),
+                    _field(fields, columns.get("HEX")),
+                )
+
+    except FileNotFoundError:
+        print(f"Error: Archivo '{file_path}' no encontrado.")
+        sys.exit(1)
+    except PermissionError:
+        print(f"Error: Sin permiso para leer archivo '{file_path}'.")
+        sys.exit(1)
+
+
+def _field(fields, position):
+    """Regresa fields[position] o None si la columna no existe."""
+    if position is None or position >= len(fields):
+        return None
+    return fields[position]
+
+
+def _parse_options(args):
+    """
+    Separa opciones (--nombre o --nombre=valor) de los archivos de entrada.
+
+    Returns:
+        Tupla (diccionario opción -> valor, lista de archivos).
+    """
+    options = {}
+    files = []
+    for arg in args:
+        if arg.startswith("--"):
+            name, _, value = arg[2:].partition("=")
+            options[name] = value or True
+        else:
+            files.append(arg)
+    return options, files
+
+
 def _get_tc_name(file_path):
     """Extrae nombre del TC del nombre del archivo (ej: TC1.txt -> TC1)."""
     base = os.path.basename(file_path)
@@ -138,44 +493,192 @@ def _get_tc_name(file_path):
     return name
 
 
+def convert_section(input_file, verify=False, ieee754=None):
+    """
+    Convierte un archivo de entrada a filas ITEM, TCn, BIN, HEX.
+
+    Args:
+        input_file: Ruta al archivo con datos numéricos.
+        verify: Si es True, decodifica cada BIN/HEX generado en la misma
+            pasada y cuenta las diferencias.
+        ieee754: None para truncar decimales (comportamiento original), o 32/64
+            para emitir el patrón IEEE-754 de las entradas no enteras.
+
+    Returns:
+        Tupla (lista de líneas de la sección, conteo verificado, conteo fallido).
+    """
+    tc_name = _get_tc_name(input_file)
+    data = read_numeric_data(input_file, keep_floats=ieee754 is not None)
+
+    # Patrones IEEE-754 de todos los flotantes, formateados en un solo lote
+    float_patterns = iter(())
+    if data.floats:
+        float_patterns = zip(*ieee754_bit_patterns(data.floats, ieee754))
+
+    # Procesar conversiones (formato: ITEM, TCn, BIN, HEX)
+    results = [f"ITEM\t{tc_name}\tBIN\tHEX"]
+    item_num = 1
+    verified = 0
+    failed = 0
+
+    for line_number, number, original in data:
+        if number is None:
+            print(f"Error: Dato inválido en línea {line_number}: '{original}'")
+            results.append(f"{item_num}\t{original}\t#VALUE!\t#VALUE!")
+        elif isinstance(number, float):
+            binary_str, hex_str = next(float_patterns)
+            if ieee754_overflows(number, ieee754):
+                print(f"Error: Valor fuera del rango de IEEE-754 de {ieee754} bits "
+                      f"en línea {line_number}: {number!r}")
+                results.append(f"{item_num}\t{number!r}\t#NUM!\t#NUM!")
+                item_num += 1
+                continue
+            if verify:
+                if verify_ieee754(number, ieee754, binary_str, hex_str):
+                    verified += 1
+                else:
+                    failed += 1
+                    print(f"Error: Verificación fallida en línea {line_number}: {number!r}")
+            results.append(f"{item_num}\t{number!r}\t{binary_str}\t{hex_str}")
+            item_num += 1
+        else:
+            binary_str = to_binary(number)
+            hex_str = to_hexadecimal(number)
+            if verify:
+                if verify_round_trip(number, binary_str, hex_str):
+                    verified += 1
+                else:
+                    failed += 1
+                    print(f"Error: Verificación fallida en línea {line_number}: {number}")
+            results.append(f"{item_num}\t{number}\t{binary_str}\t{hex_str}")
+            item_num += 1
+
+    return results, verified, failed
+
+
+def reverse_section(input_file, signed=False):
+    """
+    Decodifica las columnas BIN/HEX de un archivo de resultados a enteros.
+
+    Cuando la fila conserva el decimal original, también se comprueba el
+    viaje de ida y vuelta contra él.
+
+    Args:
+        input_file: Ruta al archivo con columnas BIN/HEX.
+        signed: Interpretar las cadenas como complemento a dos.
+
+    Returns:
+        Lista de secciones, cada una lista de líneas
+        (ITEM, TCn, BIN_DEC, HEX_DEC, MATCH).
+    """
+    sections = []
+    current_name = None
+    current = None
+
+    for name, item, original, binary_str, hex_str in read_converted_data(input_file):
+        if name != current_name:
+            current_name = name
+            current = [f"ITEM\t{name}\tBIN_DEC\tHEX_DEC\tMATCH"]
+            sections.append(current)
+        if item is None:
+            item = len(current)
+        if binary_str in ERROR_CELLS or hex_str in ERROR_CELLS:
+            error = binary_str if binary_str in ERROR_CELLS else hex_str
+            current.append(f"{item}\t{original}\t{error}\t{error}\t")
+            continue
+
+        bin_value = from_binary(binary_str, signed) if binary_str is not None else None
+        hex_value = from_hexadecimal(hex_str, signed) if hex_str is not None else None
+        if binary_str is not None and bin_value is None:
+            print(f"Error: BIN inválido en ítem {item}: '{binary_str}'")
+        if hex_str is not None and hex_value is None:
+            print(f"Error: HEX inválido en ítem {item}: '{hex_str}'")
+
+        match = ""
+        try:
+            number = int(original) if original is not None else None
+        except ValueError:
+            number = None
+        if number is not None and binary_str is not None and hex_str is not None:
+            match = "OK" if verify_round_trip(number, binary_str, hex_str) else "FAIL"
+
+        current.append(
+            f"{item}\t"
+            f"{original if original is not None else ''}\t"
+            f"{'#VALUE!' if bin_value is None else bin_value}\t"
+            f"{'' if hex_str is None else ('#VALUE!' if hex_value is None else hex_value)}\t"
+            f"{match}"
+        )
+
+    return sections
+
+
+def _ieee754_bits(options):
+    """
+    Ancho en bits de --ieee754 (sin valor = 64, sin la opción = None).
+
+    Termina con error si el valor no es 32 ni 64.
+    """
+    if "ieee754" not in options:
+        return None
+    value = options["ieee754"]
+    bits = 64 if value is True else (int(value) if value.isdigit() else 0)
+    if bits not in IEEE754_TYPECODES:
+        print("Error: --ieee754 acepta 32 o 64.")
+        sys.exit(1)
+    return bits
+
+
+def run_conversion(input_files, options):
+    """
+    Convierte cada archivo (o decodifica sus columnas BIN/HEX con --reverse).
+
+    Args:
+        input_files: Rutas de entrada.
+        options: Diccionario de opciones de la línea de comandos.
+
+    Returns:
+        Tupla (lista de secciones, línea VERIFIED o None si no aplica).
+    """
+    if "reverse" in options:
+        sections = []
+        for input_file in input_files:
+            sections.extend(reverse_section(input_file, "signed" in options))
+        return sections, None
+
+    verify = "verify" in options
+    ieee754 = _ieee754_bits(options)
+    sections = []
+    verified = 0
+    failed = 0
+    for input_file in input_files:
+        section, ok_count, fail_count = convert_section(input_file, verify, ieee754)
+        sections.append(section)
+        verified += ok_count
+        failed += fail_count
+    return sections, (f"VERIFIED\t{verified} OK\t{failed} FAIL" if verify else None)
+
+
 def main():
     """Punto de entrada principal del programa de conversión de números."""
-    if len(sys.argv) < 2:
-        print("Uso: python convert_numbers.py archivo1.txt [archivo2.txt ...]")
+    options, input_files = _parse_options(sys.argv[1:])
+    if not input_files:
+        print("Uso: python convert_numbers.py [--verify] [--ieee754=32|64] "
+              "archivo1.txt [archivo2.txt ...]")
+        print("     python convert_numbers.py --reverse [--signed] resultados.txt [...]")
         sys.exit(1)
 
-    # Archivos de entrada (uno o varios)
-    input_files = sys.argv[1:]
+    # Validar opciones antes de leer archivos
+    _ieee754_bits(options)
     # Escribir salida en carpeta results (mismo nivel que source)
     script_dir = os.path.dirname(os.path.abspath(__file__))
-    output_file = os.path.join(script_dir, "..", "results", "ConvertionResults.txt")
+    output_name = "ReverseResults.txt" if "reverse" in options else "ConvertionResults.txt"
+    output_file = os.path.join(script_dir, "..", "results", output_name)
 
     # Iniciar cronometraje
     start_time = time.time()
 
-    all_sections = []
-
-    for input_file in input_files:
-        tc_name = _get_tc_name(input_file)
-        data = read_numeric_data(input_file)
-
-        # Procesar conversiones (formato: ITEM, TCn, BIN, HEX)
-        results = []
-        item_num = 1
-
-        for line_number, number, original in data:
-            if number is None:
-                print(f"Error: Dato inválido en línea {line_number}: '{original}'")
-                results.append(f"{item_num}\t{original}\t#VALUE!\t#VALUE!")
-            else:
-                binary_str = to_binary(number)
-                hex_str = to_hexadecimal(number)
-                results.append(f"{item_num}\t{number}\t{binary_str}\t{hex_str}")
-                item_num += 1
-
-        header = f"ITEM\t{tc_name}\tBIN\tHEX"
-        section = [header] + results
-        all_sections.append(section)
+    all_sections, verified_line = run_conversion(input_files, options)
 
     # Finalizar cronometraje
     elapsed_time = time.time() - start_time
@@ -188,6 +691,8 @@ def main():
         output_lines.extend(section)
 
     output_lines.append("")
+    if verified_line is not None:
+        output_lines.append(verified_line)
     output_lines.append(f"TIME ELAPSED\t{elapsed_time:.6f} seconds")
 
     # Escribir en archivo
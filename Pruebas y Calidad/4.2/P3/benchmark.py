@@ -0,0 +1,266 @@
+"""
+Benchmarks de Word Count - Actividad 4.2 Ejercicio 3.
+
+Mide el rendimiento de word_count.py sobre los casos de prueba TC1-TC5 y
+sobre un corpus sintético (por defecto 1 GB, distribución Zipf).
+
+Invocación: python benchmark.py tokenizer [--corpus-mb=1024] [--keep-corpus]
+            python benchmark.py topk [--vocabulary=1000000] [--top=100]
+            python benchmark.py memory [--corpus-mb=200] [--vocabulary=1000000]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Agregar el directorio source al path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'source'))
+
+import tokenizer  # noqa: E402  pylint: disable=wrong-import-position
+import word_count  # noqa: E402  pylint: disable=wrong-import-position
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+TEST_FILES = [os.path.join(BASE_DIR, 'tests', f"TC{i}.txt") for i in range(1, 6)]
+
+# Separadores del corpus sintético: incluye espacios Unicode
+SEPARATORS = [' '] * 20 + ['\t', ' ', '　']
+
+
+def legacy_extract_words(line):
+    """Tokenizador original carácter por carácter (referencia del benchmark)."""
+    words = []
+    current_word = []
+    for char in line:
+        if char.isspace():
+            if current_word:
+                words.append(''.join(current_word))
+                current_word = []
+        else:
+            current_word.append(char)
+    if current_word:
+        words.append(''.join(current_word))
+    return words
+
+
+def make_vocabulary(size, seed=42):
+    """Genera size palabras pseudoaleatorias (algunas con caracteres no ASCII)."""
+    rng = random.Random(seed)
+    letters = 'abcdefghijklmnopqrstuvwxyz' * 3 + 'áéíóúñü'
+    return [''.join(rng.choices(letters, k=rng.randint(2, 12))) for _ in range(size)]
+
+
+def generate_corpus(path, size_bytes, vocabulary_size=50000, seed=42):
+    """
+    Escribe un corpus sintético con frecuencias Zipf (peso 1/rango).
+
+    Args:
+        path: Ruta del archivo a generar.
+        size_bytes: Tamaño aproximado del corpus en bytes.
+        vocabulary_size: Número de palabras distintas.
+        seed: Semilla para reproducibilidad.
+    """
+    rng = random.Random(seed)
+    vocabulary = make_vocabulary(vocabulary_size, seed)
+    cum_weights = []
+    acc = 0.0
+    for rank in range(1, vocabulary_size + 1):
+        acc += 1.0 / rank
+        cum_weights.append(acc)
+
+    written = 0
+    with open(path, 'w', encoding='utf-8') as file:
+        while written < size_bytes:
+            lines = []
+            for _ in range(1000):
+                words = rng.choices(vocabulary, cum_weights=cum_weights, k=12)
+                separator = rng.choice(SEPARATORS)
+                lines.append(separator.join(words))
+            chunk = '\n'.join(lines) + '\n'
+            file.write(chunk)
+            written += len(chunk.encode('utf-8'))
+
+
+def _time_tokenizer(file_path, tokenize_file):
+    """Regresa (segundos, número de palabras) de tokenize_file(file)."""
+    start = time.perf_counter()
+    with open(file_path, 'r', encoding='utf-8') as file:
+        total = tokenize_file(file)
+    return time.perf_counter() - start, total
+
+
+def _legacy_file(file):
+    """Cuenta palabras con el tokenizador original, línea por línea."""
+    total = 0
+    for line in file:
+        total += len(legacy_extract_words(line.strip()))
+    return total
+
+
+def _block_file(file):
+    """Cuenta palabras con el tokenizador por bloques de word_count."""
+    total = 0
+    for words in tokenizer.iter_word_blocks(file):
+        total += len(words)
+    return total
+
+
+def bench_tokenizer(paths):
+    """
+    Compara el tokenizador original contra el de word_count en MB/s.
+
+    Returns:
+        Lista de líneas del reporte.
+    """
+    lines = ["FILE\tMB\tLEGACY MB/s\tBLOCK MB/s\tSPEEDUP\tWORDS OK"]
+    for path in paths:
+        size_mb = os.path.getsize(path) / (1 << 20)
+        legacy_time, legacy_words = _time_tokenizer(path, _legacy_file)
+        block_time, block_words = _time_tokenizer(path, _block_file)
+        lines.append(
+            f"{os.path.basename(path)}\t{size_mb:.2f}\t"
+            f"{size_mb / legacy_time:.1f}\t{size_mb / block_time:.1f}\t"
+            f"{legacy_time / block_time:.1f}x\t{legacy_words == block_words}"
+        )
+    return lines
+
+
+def make_zipf_counts(vocabulary_size, seed=42):
+    """Diccionario palabra -> conteo con frecuencias Zipf y muchos empates."""
+    rng = random.Random(seed)
+    counts = {}
+    for rank in range(1, vocabulary_size + 1):
+        word = f"w{rng.getrandbits(48):012x}"
+        counts[word] = max(1, 1000000 // rank)
+    return counts
+
+
+def bench_top_k(vocabulary_size, top, repeat=3):
+    """
+    Compara el ordenamiento completo contra la selección con heap (--top).
+
+    Returns:
+        Lista de líneas del reporte.
+    """
+    counts = make_zipf_counts(vocabulary_size)
+    full_best = heap_best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        full = word_count.sort_words_by_frequency_then_name(counts)[:top]
+        full_best = min(full_best, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        heap = word_count.top_words_by_frequency_then_name(counts, top)
+        heap_best = min(heap_best, time.perf_counter() - start)
+
+    return [
+        "VOCABULARY\tTOP\tSORT s\tHEAP s\tSPEEDUP\tSAME",
+        f"{vocabulary_size}\t{top}\t{full_best:.4f}\t{heap_best:.4f}\t"
+        f"{full_best / heap_best:.1f}x\t{full == heap}",
+    ]
+
+
+def _measure_memory(read_function, path):
+    """
+    Mide la memoria retenida por la estructura de conteo.
+
+    Returns:
+        Tupla (estructura, bytes retenidos al terminar, pico de bytes, segundos).
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    word_counts, _ = read_function(path)
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return word_counts, current, peak, elapsed
+
+
+def bench_vocabulary_memory(path):
+    """
+    Compara la memoria del dict contra CompactVocabulary sobre un corpus.
+
+    Returns:
+        Lista de líneas del reporte.
+    """
+    lines = ["BACKEND\tDISTINCT\tRETAINED MB\tPEAK MB\tBYTES/WORD\tSECONDS"]
+    results = {}
+    for name, read_function in (("dict", word_count.read_words_from_file),
+                                ("compact", word_count.read_words_compact)):
+        counts, current, peak, elapsed = _measure_memory(read_function, path)
+        results[name] = word_count.sort_words_by_frequency_then_name(counts)
+        lines.append(
+            f"{name}\t{len(counts)}\t{current / (1 << 20):.1f}\t"
+            f"{peak / (1 << 20):.1f}\t{current / max(len(counts), 1):.0f}\t{elapsed:.2f}"
+        )
+        del counts
+    lines.append(f"SAME SORTED OUTPUT\t{results['dict'] == results['compact']}")
+    return lines
+
+
+def run_tokenizer(options):
+    """Subcomando tokenizer: TC1-TC5 más el corpus sintético."""
+    corpus_mb = int(options.get("corpus-mb", 1024))
+    corpus_path = os.path.join(tempfile.gettempdir(), f"word_count_corpus_{corpus_mb}MB.txt")
+    if corpus_mb > 0 and not os.path.exists(corpus_path):
+        print(f"Generando corpus sintético de {corpus_mb} MB en {corpus_path}...")
+        generate_corpus(corpus_path, corpus_mb << 20)
+
+    paths = list(TEST_FILES)
+    if corpus_mb > 0:
+        paths.append(corpus_path)
+
+    try:
+        for line in bench_tokenizer(paths):
+            print(line)
+    finally:
+        if corpus_mb > 0 and "keep-corpus" not in options:
+            os.remove(corpus_path)
+
+
+def run_top_k(options):
+    """Subcomando topk: ordenamiento completo contra heap."""
+    vocabulary_size = int(options.get("vocabulary", 1000000))
+    top = int(options.get("top", 100))
+    for line in bench_top_k(vocabulary_size, top):
+        print(line)
+
+
+def run_memory(options):
+    """Subcomando memory: dict contra CompactVocabulary en un corpus Zipf."""
+    corpus_mb = int(options.get("corpus-mb", 200))
+    vocabulary_size = int(options.get("vocabulary", 1000000))
+    corpus_path = os.path.join(tempfile.gettempdir(),
+                               f"word_count_zipf_{corpus_mb}MB_{vocabulary_size}.txt")
+    if not os.path.exists(corpus_path):
+        print(f"Generando corpus Zipf de {corpus_mb} MB ({vocabulary_size} palabras)...")
+        generate_corpus(corpus_path, corpus_mb << 20, vocabulary_size)
+    try:
+        for line in bench_vocabulary_memory(corpus_path):
+            print(line)
+    finally:
+        if "keep-corpus" not in options:
+            os.remove(corpus_path)
+
+
+# Subcomandos disponibles: nombre -> función
+COMMANDS = {
+    "tokenizer": run_tokenizer,
+    "topk": run_top_k,
+    "memory": run_memory,
+}
+
+
+def main():
+    """Punto de entrada de los benchmarks."""
+    options, positional = word_count.parse_options(sys.argv[1:])
+    if not positional or positional[0] not in COMMANDS:
+        print("Uso: python benchmark.py {" + "|".join(COMMANDS) + "} [opciones]")
+        sys.exit(1)
+    COMMANDS[positional[0]](options)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""
+Agregación en disco para Word Count - Actividad 4.2 Ejercicio 3.
+
+Cuando el diccionario de conteos supera un presupuesto de memoria, se ordena
+por palabra y se vuelca a un archivo temporal (run). Al final los runs se
+combinan con una mezcla de k vías sumando conteos, y el orden frecuencia /
+palabra se obtiene con un ordenamiento externo, así que la memoria queda
+acotada sin importar el tamaño del vocabulario.
+
+Los runs son texto UTF-8 con una entrada "a\\tb" por línea; las palabras no
+contienen espacios en blanco, así que el tabulador y el salto de línea no
+son ambiguos. Cada mezcla abre a lo más fan_in runs a la vez (sus búferes
+usan la mitad del presupuesto, hasta MAX_MERGE_FAN_IN); si hay más, se
+mezclan por pasadas en runs intermedios.
+"""
+
+import heapq
+import os
+import shutil
+import sys
+import tempfile
+
+# Costo estimado por entrada del diccionario además de los caracteres de la
+# palabra: objeto str, objeto int y espacio en la tabla hash
+ENTRY_OVERHEAD = 100
+
+# Máximo de runs abiertos en una mezcla (límite de descriptores de archivo)
+MAX_MERGE_FAN_IN = 64
+
+# Búfer de lectura por run abierto; cuenta dentro del presupuesto
+RUN_BUFFER_SIZE = 1 << 16
+
+
+def _write_run(directory, run_number, rows):
+    """Escribe filas (a, b) ya ordenadas en un run y regresa su ruta."""
+    path = os.path.join(directory, f"run{run_number:06d}.tsv")
+    with open(path, 'w', encoding='utf-8') as file:
+        file.writelines(f"{first}\t{second}\n" for first, second in rows)
+    return path
+
+
+def _read_word_run(path):
+    """Lee un run de (palabra, conteo) ordenado por palabra."""
+    with open(path, 'r', encoding='utf-8', buffering=RUN_BUFFER_SIZE) as file:
+        for line in file:
+            word, count = line.rstrip('\n').split('\t')
+            yield word, int(count)
+
+
+def _read_frequency_run(path):
+    """Lee un run de (-conteo, palabra) ordenado por frecuencia y palabra."""
+    with open(path, 'r', encoding='utf-8', buffering=RUN_BUFFER_SIZE) as file:
+        for line in file:
+            negative_count, word = line.rstrip('\n').split('\t')
+            yield int(negative_count), word
+
+
+def _sum_word_counts(rows):
+    """Suma conteos consecutivos de la misma palabra en filas ordenadas."""
+    current_word = None
+    current_count = 0
+    for word, count in rows:
+        if word == current_word:
+            current_count += count
+            continue
+        if current_word is not None:
+            yield current_word, current_count
+        current_word = word
+        current_count = count
+    if current_word is not None:
+        yield current_word, current_count
+
+
+class SpillingWordCounter:
+    """
+    Conteo de palabras con memoria acotada y volcado a disco.
+
+    Uso:
+        with SpillingWordCounter(presupuesto) as counter:
+            counter.add_words(palabras)
+            for palabra, conteo in counter.sorted_by_frequency():
+                ...
+    """
+
+    def __init__(self, budget_bytes, temp_dir=None):
+        """
+        Args:
+            budget_bytes: Memoria estimada máxima del diccionario en memoria.
+            temp_dir: Carpeta para los runs (por defecto la temporal del sistema).
+        """
+        self.budget_bytes = budget_bytes
+        self.directory = tempfile.mkdtemp(prefix="word_count_", dir=temp_dir)
+        self.word_count = {}
+        self.key_chars = 0
+        self.runs = []
+        self.run_number = 0
+        self.total = 0
+
+    @property
+    def fan_in(self):
+        """
+        Runs abiertos por mezcla: sus búferes ocupan a lo más la mitad del
+        presupuesto; la otra mitad es para el lote en memoria.
+        """
+        return max(2, min(MAX_MERGE_FAN_IN, self.budget_bytes // (2 * RUN_BUFFER_SIZE)))
+
+    def estimated_bytes(self):
+        """Memoria estimada del diccionario actual."""
+        return (sys.getsizeof(self.word_count)
+                + len(self.word_count) * ENTRY_OVERHEAD + self.key_chars)
+
+    def _new_run(self, rows):
+        """Escribe filas ordenadas en un run nuevo y regresa su ruta."""
+        path = _write_run(self.directory, self.run_number, rows)
+        self.run_number += 1
+        return path
+
+    def _reduce_runs(self, runs, reader, combine=iter):
+        """
+        Mezcla runs por pasadas hasta que queden a lo más fan_in.
+
+        Args:
+            runs: Rutas de runs ordenados.
+            reader: Función que lee un run como filas ordenadas.
+            combine: Transformación de la mezcla (p. ej. sumar duplicados).
+
+        Returns:
+            Rutas de los runs restantes; los mezclados se eliminan.
+        """
+        fan_in = self.fan_in
+        while len(runs) > fan_in:
+            group, runs = runs[:fan_in], runs[fan_in:]
+            merged = self._new_run(combine(heapq.merge(*[reader(path) for path in group])))
+            for path in group:
+                os.remove(path)
+            runs.append(merged)
+        return runs
+
+    def add_words(self, words):
+        """Cuenta una lista de palabras y vuelca a disco si excede el presupuesto."""
+        word_count = self.word_count
+        for word in words:
+            count = word_count.get(word)
+            if count is None:
+                word_count[word] = 1
+                self.key_chars += len(word)
+            else:
+                word_count[word] = count + 1
+        self.total += len(words)
+        if self.estimated_bytes() > self.budget_bytes:
+            self.spill()
+
+    def spill(self):
+        """Ordena el diccionario por palabra y lo escribe como run."""
+        if not self.word_count:
+            return
+        rows = sorted(self.word_count.items())
+        self.runs.append(self._new_run(rows))
+        self.word_count = {}
+        self.key_chars = 0
+
+    def merged_counts(self):
+        """
+        Mezcla de k vías de los runs y lo que queda en memoria.
+
+        Yields:
+            (palabra, conteo total) en orden de palabra, una vez por palabra.
+        """
+        self.runs = self._reduce_runs(self.runs, _read_word_run, _sum_word_counts)
+        sources = [_read_word_run(path) for path in self.runs]
+        sources.append(iter(sorted(self.word_count.items())))
+        yield from _sum_word_counts(heapq.merge(*sources))
+
+    def sorted_by_frequency(self):
+        """
+        Ordenamiento externo por frecuencia descendente y palabra ascendente.
+
+        Los conteos combinados se acumulan en lotes de la mitad del
+        presupuesto (la otra mitad son los búferes de la mezcla), cada lote
+        se ordena y se vuelca, y al final se mezclan.
+
+        Yields:
+            Tuplas (palabra, conteo) en el orden de sort_words_by_frequency_then_name.
+        """
+        # Liberar la memoria del conteo antes de la segunda fase
+        self.spill()
+        runs = []
+        batch = []
+        batch_bytes = 0
+        for word, count in self.merged_counts():
+            batch.append((-count, word))
+            batch_bytes += ENTRY_OVERHEAD + len(word)
+            if batch_bytes > self.budget_bytes // 2:
+                batch.sort()
+                runs.append(self._new_run(batch))
+                batch = []
+                batch_bytes = 0
+        batch.sort()
+        runs = self._reduce_runs(runs, _read_frequency_run)
+        sources = [_read_frequency_run(path) for path in runs]
+        sources.append(iter(batch))
+        for negative_count, word in heapq.merge(*sources):
+            yield word, -negative_count
+
+    def close(self):
+        """Elimina los runs temporales."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
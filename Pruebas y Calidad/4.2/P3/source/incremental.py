@@ -0,0 +1,154 @@
+"""
+Conteo incremental con checkpoint para Word Count - Actividad 4.2 Ejercicio 3.
+
+Para logs que crecen: el checkpoint guarda hasta dónde se contó y los
+conteos acumulados, así cada corrida solo lee los bytes agregados.
+"""
+
+import json
+import os
+
+from tokenizer import (READ_BLOCK_SIZE, READ_ERRORS, count_words, decode_byte_counts,
+                       exit_on_read_error)
+
+# Bytes iniciales del archivo que se guardan en el checkpoint incremental
+# para detectar rotación aunque el inodo se reutilice
+CHECKPOINT_HEAD_BYTES = 256
+CHECKPOINT_VERSION = 1
+
+# Campos obligatorios del checkpoint y su tipo
+CHECKPOINT_FIELDS = {"inode": int, "device": int, "offset": int, "head": str, "counts": dict}
+
+
+def _load_checkpoint(checkpoint_path):
+    """
+    Lee un checkpoint incremental.
+
+    Returns:
+        Diccionario del checkpoint, o None si no existe o es inválido
+        (versión distinta, campos faltantes o de otro tipo): en ese caso
+        se cuenta desde cero como si no hubiera checkpoint.
+    """
+    try:
+        with open(checkpoint_path, 'r', encoding='utf-8') as file:
+            checkpoint = json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    if not isinstance(checkpoint, dict) or checkpoint.get("version") != CHECKPOINT_VERSION:
+        return None
+    for field, field_type in CHECKPOINT_FIELDS.items():
+        value = checkpoint.get(field)
+        if not isinstance(value, field_type) or isinstance(value, bool):
+            return None
+    if checkpoint["offset"] < 0 or not all(
+            isinstance(count, int) and not isinstance(count, bool) and count > 0
+            for count in checkpoint["counts"].values()):
+        return None
+    try:
+        bytes.fromhex(checkpoint["head"])
+    except ValueError:
+        return None
+    return checkpoint
+
+
+def _save_checkpoint(checkpoint_path, checkpoint):
+    """Escribe el checkpoint de forma atómica (archivo temporal + replace)."""
+    temporary = checkpoint_path + ".tmp"
+    with open(temporary, 'w', encoding='utf-8') as file:
+        json.dump(checkpoint, file, ensure_ascii=False, separators=(',', ':'))
+    os.replace(temporary, checkpoint_path)
+
+
+def _resume_point(checkpoint_path, stat, head):
+    """
+    Desde dónde seguir contando según el checkpoint.
+
+    Returns:
+        Tupla (desplazamiento, conteos acumulados); (0, {}) si no hay
+        checkpoint válido, el archivo rotó o se truncó.
+    """
+    checkpoint = _load_checkpoint(checkpoint_path)
+    if (checkpoint is not None
+            and checkpoint["inode"] == stat.st_ino
+            and checkpoint["device"] == stat.st_dev
+            and checkpoint["offset"] <= stat.st_size
+            and head.startswith(bytes.fromhex(checkpoint["head"]))):
+        return checkpoint["offset"], checkpoint["counts"]
+    return 0, {}
+
+
+def _count_complete_lines(file, offset):
+    """
+    Cuenta los bytes desde offset hasta el último salto de línea.
+
+    Returns:
+        Tupla (conteos por palabra en bytes, nuevo desplazamiento, bytes
+        de la última línea sin salto de línea).
+    """
+    file.seek(offset)
+    byte_count = {}
+    pending = b''
+    while True:
+        block = file.read(READ_BLOCK_SIZE)
+        if not block:
+            break
+        block = pending + block
+        # Contar solo hasta el último salto de línea; el resto espera
+        cut = block.rfind(b'\n') + 1
+        count_words(block[:cut].split(), byte_count)
+        offset += cut
+        pending = block[cut:]
+    return byte_count, offset, pending
+
+
+def read_words_incremental(file_path, checkpoint_path):
+    """
+    Cuenta solo los bytes agregados desde la última corrida (logs que crecen).
+
+    El checkpoint guarda inodo, dispositivo, primeros bytes, desplazamiento
+    procesado y los conteos. Si el inodo o los primeros bytes cambiaron
+    (rotación) o el archivo es más corto que el desplazamiento (truncado),
+    se cuenta desde cero. Una última línea sin salto de línea (aún en
+    escritura) se incluye en el resultado pero no en el checkpoint, así que
+    la siguiente corrida la vuelve a contar completa.
+
+    Returns:
+        Tupla de (diccionario_frecuencia_palabras, contador_errores).
+    """
+    try:
+        with open(file_path, 'rb') as file:
+            stat = os.fstat(file.fileno())
+            head = file.read(CHECKPOINT_HEAD_BYTES)
+            offset, word_count = _resume_point(checkpoint_path, stat, head)
+            byte_count, offset, pending = _count_complete_lines(file, offset)
+
+        for word, count in decode_byte_counts(byte_count).items():
+            word_count[word] = word_count.get(word, 0) + count
+        partial_words = pending.split()
+
+    except READ_ERRORS as err:
+        exit_on_read_error(file_path, err)
+
+    _save_checkpoint(checkpoint_path, {
+        "version": CHECKPOINT_VERSION,
+        "inode": stat.st_ino,
+        "device": stat.st_dev,
+        "head": head[:min(len(head), offset)].hex(),
+        "offset": offset,
+        "counts": word_count,
+    })
+
+    # La línea parcial cuenta para este reporte, no para el checkpoint. Si
+    # se cortó a mitad de un carácter UTF-8, la palabra que no decodifica se
+    # omite; la siguiente corrida la cuenta completa
+    if partial_words:
+        partial_count = {}
+        for token in partial_words:
+            try:
+                token.decode('utf-8')
+            except UnicodeDecodeError:
+                continue
+            partial_count[token] = partial_count.get(token, 0) + 1
+        for word, count in decode_byte_counts(partial_count).items():
+            word_count[word] = word_count.get(word, 0) + count
+    return word_count, 0
@@ -0,0 +1,190 @@
+"""
+Índice invertido en disco para Word Count - Actividad 4.2 Ejercicio 3.
+
+Guarda, para cada palabra, los números de línea donde aparece, para
+responder "¿dónde aparece X?" sin volver a leer el archivo fuente.
+
+Formato (little-endian):
+    encabezado   INDEX_HEADER: magia, número de palabras, tamaños de bloques
+    entradas     INDEX_ENTRY por palabra, ordenadas por bytes UTF-8
+                 (desplazamiento y longitud de la palabra, desplazamiento
+                 y longitud de sus líneas, conteo de ocurrencias)
+    palabras     bytes UTF-8 concatenados
+    líneas       por palabra, diferencias entre líneas consecutivas
+                 codificadas como varint (7 bits por byte)
+"""
+
+import mmap
+import struct
+from array import array
+
+INDEX_MAGIC = b"WIX1"
+INDEX_HEADER = struct.Struct("<4sIQQ")
+INDEX_ENTRY = struct.Struct("<QIQIQ")
+
+
+def map_file(path, description):
+    """
+    Abre path y lo mapea en memoria de solo lectura.
+
+    Args:
+        path: Ruta del archivo.
+        description: Nombre del formato para el mensaje de error.
+
+    Returns:
+        Tupla (archivo abierto, mmap); el llamador cierra ambos.
+
+    Raises:
+        ValueError: Si el archivo está vacío (no se puede mapear).
+    """
+    file = open(path, 'rb')  # pylint: disable=consider-using-with
+    try:
+        return file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError:
+        file.close()
+        raise ValueError(f"{description} vacío o inválido: '{path}'") from None
+
+
+def encode_deltas(line_numbers):
+    """Codifica números de línea crecientes como diferencias varint."""
+    encoded = bytearray()
+    previous = 0
+    for line_number in line_numbers:
+        delta = line_number - previous
+        previous = line_number
+        while delta >= 0x80:
+            encoded.append((delta & 0x7F) | 0x80)
+            delta >>= 7
+        encoded.append(delta)
+    return encoded
+
+
+def decode_deltas(data):
+    """Decodifica diferencias varint a la lista de números de línea."""
+    line_numbers = []
+    current = 0
+    delta = 0
+    shift = 0
+    for byte in data:
+        delta |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        current += delta
+        line_numbers.append(current)
+        delta = 0
+        shift = 0
+    return line_numbers
+
+
+class IndexBuilder:
+    """Acumula palabra -> líneas (sin repetir línea) mientras se cuenta."""
+
+    __slots__ = ("postings",)
+
+    def __init__(self):
+        """Crea un índice vacío."""
+        self.postings = {}
+
+    def add_line(self, line_number, words):
+        """Registra que cada palabra de words aparece en line_number."""
+        postings = self.postings
+        for word in words:
+            lines = postings.get(word)
+            if lines is None:
+                postings[word] = array('I', (line_number,))
+            elif lines[-1] != line_number:
+                lines.append(line_number)
+
+    def write(self, path, word_count):
+        """
+        Escribe el índice en disco.
+
+        Args:
+            path: Ruta del archivo de índice.
+            word_count: Diccionario palabra -> conteo (ocurrencias totales).
+        """
+        keys = sorted((word.encode('utf-8'), word) for word in self.postings)
+        entries = bytearray()
+        words_blob = bytearray()
+        postings_blob = bytearray()
+        for key, word in keys:
+            encoded = encode_deltas(self.postings[word])
+            entries += INDEX_ENTRY.pack(len(words_blob), len(key), len(postings_blob),
+                                        len(encoded), word_count.get(word, 0))
+            words_blob += key
+            postings_blob += encoded
+        with open(path, 'wb') as file:
+            file.write(INDEX_HEADER.pack(INDEX_MAGIC, len(keys), len(words_blob),
+                                         len(postings_blob)))
+            file.write(entries)
+            file.write(words_blob)
+            file.write(postings_blob)
+
+
+class InvertedIndex:
+    """
+    Lector del índice con mmap: solo se leen las páginas que toca la búsqueda.
+
+    Uso:
+        with InvertedIndex(ruta) as index:
+            lines, count = index.lookup("palabra")
+    """
+
+    def __init__(self, path):
+        """Abre y mapea el índice; ValueError si el formato no es válido."""
+        self._file, self._map = map_file(path, "Índice")
+        if len(self._map) < INDEX_HEADER.size:
+            self.close()
+            raise ValueError(f"Índice truncado: '{path}'")
+        magic, self.size, words_size, postings_size = INDEX_HEADER.unpack_from(self._map)
+        if magic != INDEX_MAGIC:
+            self.close()
+            raise ValueError(f"Archivo que no es un índice de word_count: '{path}'")
+        self._entries = INDEX_HEADER.size
+        self._words = self._entries + self.size * INDEX_ENTRY.size
+        self._postings = self._words + words_size
+        if len(self._map) < self._postings + postings_size:
+            self.close()
+            raise ValueError(f"Índice truncado: '{path}'")
+
+    def _entry(self, position):
+        """Regresa (palabra_bytes, inicio_líneas, longitud, conteo) de la entrada."""
+        word_offset, word_length, postings_offset, postings_length, count = \
+            INDEX_ENTRY.unpack_from(self._map, self._entries + position * INDEX_ENTRY.size)
+        start = self._words + word_offset
+        return (self._map[start:start + word_length],
+                self._postings + postings_offset, postings_length, count)
+
+    def lookup(self, word):
+        """
+        Busca word con búsqueda binaria sobre las entradas ordenadas.
+
+        Returns:
+            Tupla (lista de números de línea, conteo de ocurrencias);
+            ([], 0) si la palabra no está.
+        """
+        key = word.encode('utf-8')
+        low, high = 0, self.size
+        while low < high:
+            middle = (low + high) // 2
+            if self._entry(middle)[0] < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.size:
+            found, start, length, count = self._entry(low)
+            if found == key:
+                return decode_deltas(self._map[start:start + length]), count
+        return [], 0
+
+    def close(self):
+        """Libera el mapeo y el archivo."""
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,128 @@
+"""
+Conteo de n-gramas para Word Count - Actividad 4.2 Ejercicio 3.
+
+Bigramas, trigramas, etc. con una ventana deslizante que continúa entre
+líneas y bloques de un archivo, sobre ids enteros de palabras y con poda
+opcional de los n-gramas menos frecuentes.
+"""
+
+import heapq
+
+from tokenizer import iter_file_words
+
+
+class NgramTable:
+    """
+    Conteos de los n-gramas de un tamaño.
+
+    counts mapea tupla de ids -> conteo, total es el número de n-gramas
+    vistos (incluye los desalojados) y prune_floor el mayor conteo desalojado.
+    """
+
+    __slots__ = ("counts", "total", "prune_floor")
+
+    def __init__(self):
+        self.counts = {}
+        self.total = 0
+        self.prune_floor = 0
+
+    def prune(self, max_entries):
+        """Desaloja los n-gramas de menor conteo hasta quedar en max_entries."""
+        counts = self.counts
+        evicted = heapq.nsmallest(len(counts) - max_entries, counts.items(),
+                                  key=lambda item: item[1])
+        for key, _ in evicted:
+            del counts[key]
+        self.prune_floor = max(self.prune_floor, evicted[-1][1])
+
+    def as_words(self, tokens):
+        """Diccionario "palabra1 palabra2 ..." -> conteo, con tokens[id] = palabra."""
+        return {' '.join(tokens[token_id] for token_id in key): count
+                for key, count in self.counts.items()}
+
+
+class NgramCounter:
+    """
+    Conteo de n-gramas con ventana deslizante entre líneas y bloques.
+
+    Cada palabra distinta recibe un id entero (interning); los n-gramas se
+    guardan como tuplas de ids, no como cadenas concatenadas. Si una tabla
+    supera max_entries, se desalojan los n-gramas menos frecuentes hasta
+    volver al límite, como en el conteo con pérdida.
+    """
+
+    __slots__ = ("sizes", "max_entries", "token_ids", "tokens", "window", "tables")
+
+    def __init__(self, sizes, max_entries=None):
+        """
+        Args:
+            sizes: Tamaños de n-grama a contar (p. ej. (2, 3)).
+            max_entries: Máximo de n-gramas distintos por tamaño, o None.
+        """
+        self.sizes = tuple(sorted(set(sizes)))
+        self.max_entries = max_entries
+        self.token_ids = {}
+        self.tokens = []
+        self.window = []
+        self.tables = {n: NgramTable() for n in self.sizes}
+
+    def reset_window(self):
+        """Corta la ventana (p. ej. al cambiar de archivo)."""
+        self.window = []
+
+    def add_words(self, words):
+        """Agrega una lista de palabras, continuando la ventana previa."""
+        token_ids = self.token_ids
+        tokens = self.tokens
+        window = self.window
+        largest = self.sizes[-1]
+        tables = [(n, self.tables[n].counts) for n in self.sizes]
+        # Un n-grama por palabra desde que la ventana alcanza n palabras
+        for n in self.sizes:
+            self.tables[n].total += max(0, len(words) - max(0, n - 1 - len(window)))
+        for word in words:
+            token_id = token_ids.get(word)
+            if token_id is None:
+                token_id = token_ids[word] = len(tokens)
+                tokens.append(word)
+            window.append(token_id)
+            if len(window) > largest:
+                del window[0]
+            length = len(window)
+            for n, counts in tables:
+                if length >= n:
+                    key = tuple(window[length - n:])
+                    counts[key] = counts.get(key, 0) + 1
+        if self.max_entries is not None:
+            for n, counts in tables:
+                if len(counts) > self.max_entries:
+                    self.tables[n].prune(self.max_entries)
+
+    def as_words(self, n):
+        """Diccionario "palabra1 palabra2 ..." -> conteo para el tamaño n."""
+        return self.tables[n].as_words(self.tokens)
+
+
+def read_ngrams(file_paths, sizes, max_entries=None, normalizer=None):
+    """
+    Cuenta n-gramas de uno o varios archivos en una sola pasada por archivo.
+
+    La ventana continúa entre líneas y bloques, y se reinicia entre archivos.
+
+    Args:
+        file_paths: Lista de rutas.
+        sizes: Tamaños de n-grama.
+        max_entries: Límite de n-gramas distintos por tamaño (None = sin límite).
+        normalizer: TokenNormalizer opcional (memoizado) aplicado a cada palabra.
+
+    Returns:
+        NgramCounter con los conteos.
+    """
+    counter = NgramCounter(sizes, max_entries)
+    for file_path in file_paths:
+        counter.reset_window()
+        for words in iter_file_words(file_path):
+            if normalizer is not None:
+                words = [word for word in map(normalizer, words) if word is not None]
+            counter.add_words(words)
+    return counter
@@ -0,0 +1,111 @@
+"""
+Normalización de palabras para Word Count - Actividad 4.2 Ejercicio 3.
+
+Los conteos se acumulan sobre las palabras tal cual aparecen en el texto y
+se normalizan al final: cada palabra distinta pasa una sola vez por las
+transformaciones (memoizadas), así el costo depende del tamaño del
+vocabulario y no del número de ocurrencias.
+"""
+
+import sys
+import unicodedata
+
+# Pasos disponibles para --normalize, en el orden en que se aplican
+NORMALIZATION_STEPS = ("nfkc", "casefold", "punct")
+
+
+def _is_punctuation(char):
+    """True si char es puntuación Unicode (categorías P*)."""
+    return unicodedata.category(char).startswith('P')
+
+
+class TokenNormalizer:
+    """
+    Normalizador de palabras con caché palabra_original -> normalizada.
+
+    Pasos (en orden): NFKC, casefold, quitar puntuación al inicio y al final,
+    y eliminar palabras vacías (stopwords). Una palabra que queda vacía o es
+    stopword se normaliza a None y no se cuenta.
+    """
+
+    __slots__ = ("steps", "stopwords", "cache")
+
+    def __init__(self, steps=(), stopwords=()):
+        """
+        Crea el normalizador.
+
+        Args:
+            steps: Nombres de pasos de NORMALIZATION_STEPS a aplicar.
+            stopwords: Palabras a descartar; se normalizan con los mismos pasos.
+        """
+        unknown = set(steps) - set(NORMALIZATION_STEPS)
+        if unknown:
+            raise ValueError(f"Pasos de normalización desconocidos: {sorted(unknown)}")
+        self.steps = tuple(step for step in NORMALIZATION_STEPS if step in steps)
+        self.cache = {}
+        self.stopwords = frozenset(
+            word for word in map(self._transform, stopwords) if word
+        )
+
+    def _transform(self, token):
+        """Aplica los pasos configurados, sin caché ni stopwords."""
+        for step in self.steps:
+            if step == "nfkc":
+                token = unicodedata.normalize("NFKC", token)
+            elif step == "casefold":
+                token = token.casefold()
+            else:
+                start = 0
+                end = len(token)
+                while start < end and _is_punctuation(token[start]):
+                    start += 1
+                while end > start and _is_punctuation(token[end - 1]):
+                    end -= 1
+                token = token[start:end]
+        return token
+
+    def __call__(self, token):
+        """Palabra normalizada (memoizada), o None si se descarta."""
+        cache = self.cache
+        if token in cache:
+            return cache[token]
+        normalized = self._transform(token)
+        if not normalized or normalized in self.stopwords:
+            normalized = None
+        cache[token] = normalized
+        return normalized
+
+    def fold(self, word_count):
+        """
+        Agrupa conteos de palabras originales por su forma normalizada.
+
+        Args:
+            word_count: Diccionario (o CompactVocabulary) palabra -> conteo.
+
+        Returns:
+            Diccionario palabra_normalizada -> conteo total.
+        """
+        folded = {}
+        for token, count in word_count.items():
+            normalized = self(token)
+            if normalized is not None:
+                folded[normalized] = folded.get(normalized, 0) + count
+        return folded
+
+
+def load_stopwords(file_path):
+    """
+    Lee stopwords de un archivo (separadas por espacios o saltos de línea).
+
+    Returns:
+        Lista de palabras.
+    """
+    try:
+        with open(file_path, 'r', encoding='utf-8') as file:
+            return file.read().split()
+    except FileNotFoundError:
+        print(f"Error: Archivo de stopwords '{file_path}' no encontrado.")
+        sys.exit(1)
+    except PermissionError:
+        print(f"Error: Sin permiso para leer archivo '{file_path}'.")
+        sys.exit(1)
@@ -0,0 +1,267 @@
+"""
+Conteo paralelo por rangos de bytes para Word Count - Actividad 4.2 Ejercicio 3.
+
+El archivo se divide en rangos que terminan en salto de línea; cada proceso
+cuenta un rango (exacto, aproximado o cardinalidad) y los resultados
+parciales se combinan al final (map-reduce).
+"""
+
+import os
+import sys
+from multiprocessing import Pool
+
+from sketches import ApproximateWordCounter, HyperLogLog
+from tokenizer import (READ_BLOCK_SIZE, READ_ERRORS, count_words, exit_on_read_error,
+                       iter_file_words)
+
+# Rangos de bytes por proceso en modo paralelo (más rangos que procesos
+# para balancear la carga)
+RANGES_PER_WORKER = 4
+
+
+def split_byte_ranges(file_path, parts):
+    """
+    Divide un archivo en rangos de bytes que terminan en salto de línea.
+
+    Como los cortes caen justo después de b"\\n", ningún rango parte una
+    palabra ni una secuencia UTF-8.
+
+    Args:
+        file_path: Ruta al archivo.
+        parts: Número deseado de rangos.
+
+    Returns:
+        Lista de tuplas (inicio, fin) en bytes, sin rangos vacíos.
+    """
+    size = os.path.getsize(file_path)
+    ranges = []
+    start = 0
+    with open(file_path, 'rb') as file:
+        for index in range(1, parts + 1):
+            if start >= size:
+                break
+            end = size * index // parts
+            if end <= start:
+                continue
+            if end < size:
+                file.seek(end)
+                file.readline()
+                end = file.tell()
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def worker_ranges(file_path, workers):
+    """
+    Rangos de bytes para repartir file_path entre workers procesos.
+
+    Termina con error si el archivo no existe o no se puede leer.
+    """
+    try:
+        ranges = split_byte_ranges(file_path, workers * RANGES_PER_WORKER)
+    except READ_ERRORS as err:
+        exit_on_read_error(file_path, err)
+    return ranges
+
+
+def iter_range_words(file_path, start, end):
+    """
+    Tokeniza un rango de bytes alineado a salto de línea, por bloques.
+
+    Yields:
+        Listas de palabras, una por bloque.
+    """
+    with open(file_path, 'rb') as file:
+        file.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            block = file.read(min(READ_BLOCK_SIZE, remaining))
+            if not block:
+                break
+            remaining -= len(block)
+            if remaining > 0 and not block.endswith(b'\n'):
+                # Completar la línea para no partir palabras entre bloques
+                tail = file.readline()
+                remaining -= len(tail)
+                block += tail
+            yield block.decode('utf-8').split()
+
+
+def _run_range_task(task):
+    """
+    Ejecuta worker(args) en un proceso del Pool.
+
+    Un rango con bytes que no son UTF-8 lanza UnicodeDecodeError en el
+    proceso hijo; se convierte en None para que el proceso padre reporte el
+    error una sola vez, igual que iter_file_words.
+    """
+    worker, args = task
+    try:
+        return worker(args)
+    except UnicodeDecodeError:
+        return None
+
+
+def map_byte_ranges(worker, tasks, workers):
+    """
+    Reparte tareas (ruta, inicio, fin, ...) entre procesos.
+
+    Termina con error si algún rango del archivo no es texto UTF-8.
+
+    Yields:
+        Resultado de worker por tarea, en orden de terminación.
+    """
+    with Pool(processes=workers) as pool:
+        for result in pool.imap_unordered(_run_range_task,
+                                          [(worker, task) for task in tasks]):
+            if result is None:
+                print(f"Error: Archivo '{tasks[0][0]}' no es texto UTF-8.")
+                sys.exit(1)
+            yield result
+
+
+def count_byte_range(task):
+    """
+    Cuenta las palabras de un rango de bytes (trabajo de cada proceso).
+
+    Args:
+        task: Tupla (ruta_archivo, inicio, fin).
+
+    Returns:
+        Diccionario palabra -> conteo del rango.
+    """
+    word_count = {}
+    for words in iter_range_words(*task):
+        count_words(words, word_count)
+    return word_count
+
+
+def approx_count_blocks(blocks, settings):
+    """
+    Cuenta bloques de palabras en un ApproximateWordCounter.
+
+    Cada bloque se cuenta primero en un diccionario local, así el sketch se
+    actualiza una vez por palabra distinta del bloque y no por ocurrencia.
+
+    Args:
+        blocks: Iterable de listas de palabras.
+        settings: Tupla (width, depth, capacidad_heavy_hitters).
+
+    Returns:
+        ApproximateWordCounter con los conteos.
+    """
+    width, depth, capacity = settings
+    counter = ApproximateWordCounter(width, depth, capacity)
+    for words in blocks:
+        block_count = {}
+        count_words(words, block_count)
+        counter.add_counts(block_count)
+    return counter
+
+
+def approx_count_byte_range(task):
+    """Trabajo de cada proceso en modo aproximado: (ruta, inicio, fin, settings)."""
+    file_path, start, end, settings = task
+    return approx_count_blocks(iter_range_words(file_path, start, end), settings)
+
+
+def cardinality_blocks(blocks, precision):
+    """
+    Estima palabras distintas de bloques de palabras con un HyperLogLog.
+
+    Cada bloque se reduce a un set antes de actualizar el HyperLogLog, así
+    se calcula un hash por palabra distinta del bloque y no por ocurrencia.
+
+    Returns:
+        Tupla (HyperLogLog, total exacto de palabras).
+    """
+    hll = HyperLogLog(precision)
+    total = 0
+    for words in blocks:
+        total += len(words)
+        hll.update(set(words))
+    return hll, total
+
+
+def cardinality_byte_range(task):
+    """Trabajo de cada proceso en modo cardinalidad: (ruta, inicio, fin, precisión)."""
+    file_path, start, end, precision = task
+    hll, total = cardinality_blocks(iter_range_words(file_path, start, end), precision)
+    return hll.to_bytes(), total
+
+
+def read_cardinality(file_path, precision, workers=1):
+    """
+    Estima el número de palabras distintas en una sola pasada.
+
+    Con workers > 1 cada proceso llena su propio HyperLogLog con un rango
+    de bytes y los registros se combinan al final.
+
+    Returns:
+        Tupla (HyperLogLog, total exacto de palabras).
+    """
+    if workers <= 1:
+        return cardinality_blocks(iter_file_words(file_path), precision)
+
+    ranges = worker_ranges(file_path, workers)
+
+    hll = HyperLogLog(precision)
+    total = 0
+    tasks = [(file_path, start, end, precision) for start, end in ranges]
+    for data, partial_total in map_byte_ranges(cardinality_byte_range, tasks, workers):
+        hll.merge(HyperLogLog.from_bytes(data))
+        total += partial_total
+    return hll, total
+
+
+def read_words_approx(file_path, settings, workers=1):
+    """
+    Cuenta palabras de forma aproximada en memoria fija (Count-Min Sketch).
+
+    Con workers > 1 cada proceso cuenta un rango de bytes en su propio
+    sketch y los sketches se combinan al final.
+
+    Args:
+        file_path: Ruta al archivo que contiene texto.
+        settings: Tupla (width, depth, capacidad_heavy_hitters).
+        workers: Número de procesos.
+
+    Returns:
+        ApproximateWordCounter con los conteos del archivo.
+    """
+    if workers <= 1:
+        return approx_count_blocks(iter_file_words(file_path), settings)
+
+    ranges = worker_ranges(file_path, workers)
+
+    tasks = [(file_path, start, end, settings) for start, end in ranges]
+    counter = ApproximateWordCounter(*settings)
+    for partial in map_byte_ranges(approx_count_byte_range, tasks, workers):
+        counter.merge(partial)
+    return counter
+
+
+def merge_word_counts(partials, copy=False):
+    """
+    Combina diccionarios parciales, del más grande al más pequeño.
+
+    El resultado reutiliza el diccionario más grande y le suma los demás,
+    así solo se copian las entradas de los diccionarios pequeños.
+
+    Args:
+        partials: Lista de diccionarios palabra -> conteo.
+        copy: Si es True, no modifica ningún diccionario de entrada (el más
+            grande se copia con dict(), que es una copia en C).
+
+    Returns:
+        Diccionario combinado.
+    """
+    if not partials:
+        return {}
+    ordered = sorted(partials, key=len, reverse=True)
+    merged = dict(ordered[0]) if copy else ordered[0]
+    for partial in ordered[1:]:
+        for word, count in partial.items():
+            merged[word] = merged.get(word, 0) + count
+    return merged
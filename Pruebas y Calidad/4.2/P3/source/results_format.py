@@ -0,0 +1,165 @@
+"""
+Formatos de resultados legibles por máquina para Word Count - Actividad 4.2 Ejercicio 3.
+
+Además del reporte {TC}.Results.txt, los conteos ordenados pueden escribirse
+como CSV, JSON Lines o un binario compacto que otras herramientas consultan
+con mmap sin parsear texto.
+
+Formato binario (little-endian):
+    encabezado   RESULTS_HEADER: magia, número de palabras, total, tamaño tabla
+    conteos      n enteros de 64 bits, en el orden del reporte
+    offsets      n enteros de 64 bits: posición de cada palabra en la tabla
+    por_palabra  n enteros de 32 bits: posiciones ordenadas por bytes UTF-8
+                 (búsqueda binaria), más relleno a múltiplo de 8
+    tabla        por palabra: longitud (32 bits) + bytes UTF-8
+"""
+
+import csv
+import json
+import struct
+
+from inverted_index import map_file
+
+RESULTS_MAGIC = b"WCR1"
+RESULTS_HEADER = struct.Struct("<4sIQQ")
+COUNT = struct.Struct("<Q")
+POSITION = struct.Struct("<I")
+LENGTH = struct.Struct("<I")
+
+# Los conteos empiezan justo después del encabezado
+COUNTS_START = RESULTS_HEADER.size
+
+# Extensión de archivo por formato
+STRUCTURED_FORMATS = {"csv": "csv", "jsonl": "jsonl", "binary": "bin"}
+
+
+def write_csv(path, sorted_words):
+    """Escribe "word,count" por fila, en el orden dado."""
+    with open(path, 'w', encoding='utf-8', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(("word", "count"))
+        writer.writerows(sorted_words)
+
+
+def write_jsonl(path, sorted_words):
+    """Escribe un objeto {"word": ..., "count": ...} por línea."""
+    with open(path, 'w', encoding='utf-8') as file:
+        for word, count in sorted_words:
+            file.write(json.dumps({"word": word, "count": count}, ensure_ascii=False))
+            file.write('\n')
+
+
+def write_binary(path, sorted_words, total_count):
+    """
+    Escribe el formato binario compacto.
+
+    Args:
+        path: Ruta del archivo.
+        sorted_words: Lista de (palabra, conteo) en el orden del reporte.
+        total_count: Grand Total (puede exceder la suma si se usó --top).
+    """
+    keys = [word.encode('utf-8') for word, _ in sorted_words]
+    table = bytearray()
+    offsets = bytearray()
+    for key in keys:
+        offsets += COUNT.pack(len(table))
+        table += LENGTH.pack(len(key)) + key
+    by_word = bytearray()
+    for position in sorted(range(len(keys)), key=keys.__getitem__):
+        by_word += POSITION.pack(position)
+    by_word += bytes(-len(by_word) % 8)
+
+    with open(path, 'wb') as file:
+        file.write(RESULTS_HEADER.pack(RESULTS_MAGIC, len(keys), total_count, len(table)))
+        file.write(b''.join(COUNT.pack(count) for _, count in sorted_words))
+        file.write(offsets)
+        file.write(by_word)
+        file.write(table)
+
+
+def write_structured(path, output_format, sorted_words, total_count):
+    """Escribe sorted_words en el formato indicado (csv, jsonl o binary)."""
+    if output_format == "csv":
+        write_csv(path, sorted_words)
+    elif output_format == "jsonl":
+        write_jsonl(path, sorted_words)
+    else:
+        write_binary(path, sorted_words, total_count)
+
+
+class BinaryResults:
+    """
+    Lector del formato binario con mmap.
+
+    Uso:
+        with BinaryResults(ruta) as results:
+            results.get("palabra")      # conteo o None
+            results[0]                  # (palabra, conteo) más frecuente
+    """
+
+    def __init__(self, path):
+        """Abre y mapea el archivo; ValueError si no es un resultado binario."""
+        self._file, self._map = map_file(path, "Resultado binario")
+        if len(self._map) < RESULTS_HEADER.size:
+            self.close()
+            raise ValueError(f"Resultado binario truncado: '{path}'")
+        magic, self.size, self.total, table_size = RESULTS_HEADER.unpack_from(self._map)
+        if magic != RESULTS_MAGIC:
+            self.close()
+            raise ValueError(f"Archivo que no es un resultado binario de word_count: '{path}'")
+        self._offsets = COUNTS_START + 8 * self.size
+        self._by_word = self._offsets + 8 * self.size
+        self._table = self._by_word + 4 * self.size + (-4 * self.size) % 8
+        if len(self._map) < self._table + table_size:
+            self.close()
+            raise ValueError(f"Resultado binario truncado: '{path}'")
+
+    def __len__(self):
+        return self.size
+
+    def word(self, position):
+        """Palabra en la posición indicada (orden del reporte)."""
+        return self._key(position).decode('utf-8')
+
+    def count(self, position):
+        """Conteo en la posición indicada."""
+        return COUNT.unpack_from(self._map, COUNTS_START + 8 * position)[0]
+
+    def __getitem__(self, position):
+        if not 0 <= position < self.size:
+            raise IndexError(position)
+        return self.word(position), self.count(position)
+
+    def _key(self, position):
+        """Bytes UTF-8 de la palabra en la posición indicada."""
+        start = self._table + COUNT.unpack_from(self._map, self._offsets + 8 * position)[0]
+        length = LENGTH.unpack_from(self._map, start)[0]
+        return self._map[start + 4:start + 4 + length]
+
+    def get(self, word, default=None):
+        """Conteo de word por búsqueda binaria, o default si no está."""
+        key = word.encode('utf-8')
+        low, high = 0, self.size
+        while low < high:
+            middle = (low + high) // 2
+            position = POSITION.unpack_from(self._map, self._by_word + 4 * middle)[0]
+            if self._key(position) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.size:
+            position = POSITION.unpack_from(self._map, self._by_word + 4 * low)[0]
+            if self._key(position) == key:
+                return self.count(position)
+        return default
+
+    def close(self):
+        """Libera el mapeo y el archivo."""
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,335 @@
+"""
+Estructuras probabilísticas para Word Count - Actividad 4.2 Ejercicio 3.
+
+Permiten contar palabras (o solo estimar cuántas distintas hay) en memoria
+fija cuando el vocabulario exacto no cabe en RAM. Todas usan un hash estable
+(blake2b), por lo que los resultados de distintos archivos o procesos se
+pueden combinar con merge().
+"""
+
+import hashlib
+import math
+import struct
+import sys
+from array import array
+from operator import add
+
+# Encabezados de la serialización binaria
+CMS_MAGIC = b"CMS1"
+CMS_HEADER = struct.Struct("<4sIIQQ")
+HLL_MAGIC = b"HLL1"
+HLL_HEADER = struct.Struct("<4sBQ")
+
+
+def stable_hash64(word, seed=0):
+    """
+    Hash de 64 bits de una palabra, igual en todos los procesos.
+
+    hash() de Python cambia entre procesos (PYTHONHASHSEED), así que no sirve
+    para combinar estructuras calculadas en procesos distintos.
+    """
+    digest = hashlib.blake2b(
+        word.encode("utf-8"), digest_size=8, salt=seed.to_bytes(16, "little")
+    ).digest()
+    return int.from_bytes(digest, "little")
+
+
+class CountMinSketch:
+    """
+    Count-Min Sketch: matriz depth x width de contadores.
+
+    estimate(palabra) nunca subestima; con probabilidad 1 - delta sobreestima
+    a lo más epsilon * total, donde epsilon = e / width y delta = e^-depth.
+    """
+
+    __slots__ = ("width", "depth", "seed", "table", "total")
+
+    def __init__(self, width=1 << 16, depth=4, seed=0):
+        """Crea un sketch vacío de width columnas y depth filas."""
+        if width < 1 or depth < 1:
+            raise ValueError("width y depth deben ser positivos")
+        self.width = width
+        self.depth = depth
+        self.seed = seed
+        self.table = array('q', bytes(8 * width * depth))
+        self.total = 0
+
+    @classmethod
+    def from_error(cls, epsilon, delta, seed=0):
+        """Crea un sketch con error relativo epsilon y probabilidad de fallo delta."""
+        width = math.ceil(math.e / epsilon)
+        depth = math.ceil(math.log(1.0 / delta))
+        return cls(width, depth, seed)
+
+    @property
+    def epsilon(self):
+        """Error relativo al total (e / width)."""
+        return math.e / self.width
+
+    @property
+    def delta(self):
+        """Probabilidad de exceder el error (e^-depth)."""
+        return math.exp(-self.depth)
+
+    def error_bound(self):
+        """Sobreestimación máxima (epsilon * total) con probabilidad 1 - delta."""
+        return self.epsilon * self.total
+
+    def _indexes(self, word):
+        """Posiciones de word en cada fila (doble hash h1 + fila * h2)."""
+        value = stable_hash64(word, self.seed)
+        h1 = value & 0xFFFFFFFF
+        h2 = (value >> 32) | 1
+        width = self.width
+        return [row * width + (h1 + row * h2) % width for row in range(self.depth)]
+
+    def add(self, word, count=1):
+        """Suma count ocurrencias de word y regresa la nueva estimación."""
+        table = self.table
+        estimate = None
+        for index in self._indexes(word):
+            table[index] += count
+            if estimate is None or table[index] < estimate:
+                estimate = table[index]
+        self.total += count
+        return estimate
+
+    def estimate(self, word):
+        """Estimación (cota superior) del conteo de word."""
+        table = self.table
+        return min(table[index] for index in self._indexes(word))
+
+    def merge(self, other):
+        """Suma otro sketch con las mismas dimensiones y semilla."""
+        if (self.width, self.depth, self.seed) != (other.width, other.depth, other.seed):
+            raise ValueError("Solo se pueden combinar sketches con mismas dimensiones y semilla")
+        self.table = array('q', map(add, self.table, other.table))
+        self.total += other.total
+
+    def to_bytes(self):
+        """Serializa el sketch (encabezado + contadores little-endian)."""
+        table = array('q', self.table)
+        if sys.byteorder == "big":
+            table.byteswap()
+        header = CMS_HEADER.pack(CMS_MAGIC, self.width, self.depth, self.seed, self.total)
+        return header + table.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Reconstruye un sketch serializado con to_bytes."""
+        magic, width, depth, seed, total = CMS_HEADER.unpack_from(data)
+        if magic != CMS_MAGIC:
+            raise ValueError("Datos que no son un Count-Min Sketch")
+        sketch = cls(width, depth, seed)
+        table = array('q')
+        table.frombytes(data[CMS_HEADER.size:CMS_HEADER.size + 8 * width * depth])
+        if sys.byteorder == "big":
+            table.byteswap()
+        sketch.table = table
+        sketch.total = total
+        return sketch
+
+
+class HeavyHitters:
+    """
+    Candidatos a palabras más frecuentes con capacidad fija.
+
+    Guarda palabra -> estimación; cuando está lleno, una palabra nueva solo
+    entra si su estimación supera el mínimo actual (que se desaloja).
+
+    Se lleva el mínimo y cuántas palabras lo tienen: actualizar un
+    candidato solo recorre la tabla cuando sube la última palabra empatada
+    en el mínimo.
+    """
+
+    __slots__ = ("capacity", "counts", "_minimum", "_at_minimum")
+
+    def __init__(self, capacity):
+        """Crea una tabla vacía para capacity palabras."""
+        self.capacity = capacity
+        self.counts = {}
+        self._minimum = 0
+        self._at_minimum = 0
+
+    def _rescan(self):
+        """Recalcula el mínimo y sus empates; O(capacity)."""
+        minimum = min(self.counts.values())
+        self._minimum = minimum
+        self._at_minimum = sum(1 for value in self.counts.values() if value == minimum)
+
+    def _left_minimum(self):
+        """Una palabra dejó el mínimo (subió o se desalojó)."""
+        self._at_minimum -= 1
+        if self._at_minimum == 0:
+            self._rescan()
+
+    def offer(self, word, estimate):
+        """Registra la estimación actual de word."""
+        counts = self.counts
+        previous = counts.get(word)
+        if previous is not None:
+            counts[word] = estimate
+            if len(counts) < self.capacity or estimate == previous:
+                return
+            if estimate < self._minimum:
+                self._rescan()
+            elif previous == self._minimum:
+                self._left_minimum()
+            return
+        if len(counts) < self.capacity:
+            counts[word] = estimate
+            if len(counts) == self.capacity:
+                self._rescan()
+            return
+        if estimate <= self._minimum:
+            return
+        # Desalojar un mínimo; O(capacity), pero solo ocurre cuando una
+        # palabra supera al candidato más débil
+        minimum = self._minimum
+        del counts[next(key for key, value in counts.items() if value == minimum)]
+        counts[word] = estimate
+        self._left_minimum()
+
+    def items(self):
+        """Pares (palabra, estimación)."""
+        return self.counts.items()
+
+
+class ApproximateWordCounter:
+    """
+    Conteo aproximado de palabras en memoria fija.
+
+    Combina un CountMinSketch (conteos estimados de cualquier palabra) con
+    HeavyHitters (qué palabras reportar). El total de palabras es exacto.
+    """
+
+    __slots__ = ("sketch", "hitters")
+
+    def __init__(self, width=1 << 16, depth=4, capacity=1000, seed=0):
+        """Crea un contador vacío."""
+        self.sketch = CountMinSketch(width, depth, seed)
+        self.hitters = HeavyHitters(capacity)
+
+    @property
+    def total(self):
+        """Número exacto de palabras contadas."""
+        return self.sketch.total
+
+    def add_counts(self, word_count):
+        """Suma un diccionario palabra -> conteo (p. ej. el de un bloque)."""
+        sketch = self.sketch
+        offer = self.hitters.offer
+        for word, count in word_count.items():
+            offer(word, sketch.add(word, count))
+
+    def merge(self, other):
+        """Combina otro contador (de otro archivo o proceso)."""
+        self.sketch.merge(other.sketch)
+        candidates = set(self.hitters.counts)
+        candidates.update(other.hitters.counts)
+        self.hitters = HeavyHitters(self.hitters.capacity)
+        estimate = self.sketch.estimate
+        for word in sorted(candidates):
+            self.hitters.offer(word, estimate(word))
+
+    def top(self, k=None):
+        """
+        Palabras más frecuentes estimadas.
+
+        Returns:
+            Lista de (palabra, estimación) por estimación descendente y
+            palabra ascendente, de longitud <= k.
+        """
+        estimate = self.sketch.estimate
+        ranked = sorted(((word, estimate(word)) for word in self.hitters.counts),
+                        key=lambda x: (-x[1], x[0]))
+        return ranked if k is None else ranked[:k]
+
+    def error_bound(self):
+        """Sobreestimación máxima de cada conteo (con probabilidad 1 - delta)."""
+        return self.sketch.error_bound()
+
+    def __getstate__(self):
+        """Estado serializable para enviarlo entre procesos."""
+        return (self.sketch.to_bytes(), self.hitters.capacity, dict(self.hitters.counts))
+
+    def __setstate__(self, state):
+        """Reconstruye el contador desde __getstate__."""
+        sketch_bytes, capacity, counts = state
+        self.sketch = CountMinSketch.from_bytes(sketch_bytes)
+        self.hitters = HeavyHitters(capacity)
+        for word, estimate in counts.items():
+            self.hitters.offer(word, estimate)
+
+
+class HyperLogLog:
+    """
+    Estimación del número de palabras distintas en memoria fija.
+
+    Usa 2^precision registros de un byte (precision=12 -> 4 KB) con error
+    estándar relativo de 1.04 / sqrt(2^precision). Combinar dos estructuras
+    (merge) es tomar el máximo registro a registro.
+    """
+
+    __slots__ = ("precision", "registers", "seed")
+
+    def __init__(self, precision=12, seed=0):
+        """Crea registros vacíos; precision entre 4 y 18."""
+        if not 4 <= precision <= 18:
+            raise ValueError("precision debe estar entre 4 y 18")
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+        self.seed = seed
+
+    def add(self, word):
+        """Registra una palabra (agregar la misma palabra de nuevo no cambia nada)."""
+        value = stable_hash64(word, self.seed)
+        width = 64 - self.precision
+        register = value >> width
+        rest = value & ((1 << width) - 1)
+        # Posición del primer bit 1 en los bits restantes (1 = bit más alto)
+        rank = width - rest.bit_length() + 1
+        if rank > self.registers[register]:
+            self.registers[register] = rank
+
+    def update(self, words):
+        """Registra un iterable de palabras."""
+        add_word = self.add
+        for word in words:
+            add_word(word)
+
+    def standard_error(self):
+        """Error estándar relativo de la estimación."""
+        return 1.04 / math.sqrt(len(self.registers))
+
+    def estimate(self):
+        """Número estimado de palabras distintas."""
+        registers = self.registers
+        size = len(registers)
+        alpha = 0.7213 / (1 + 1.079 / size)
+        raw = alpha * size * size / sum(2.0 ** -rank for rank in registers)
+        zeros = registers.count(0)
+        if raw <= 2.5 * size and zeros:
+            # Corrección de rango pequeño (conteo lineal)
+            return size * math.log(size / zeros)
+        return raw
+
+    def merge(self, other):
+        """Combina otra estructura con la misma precisión y semilla."""
+        if (self.precision, self.seed) != (other.precision, other.seed):
+            raise ValueError("Solo se pueden combinar HyperLogLog con misma precisión y semilla")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+    def to_bytes(self):
+        """Serializa (encabezado + registros)."""
+        return HLL_HEADER.pack(HLL_MAGIC, self.precision, self.seed) + bytes(self.registers)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Reconstruye una estructura serializada con to_bytes."""
+        magic, precision, seed = HLL_HEADER.unpack_from(data)
+        if magic != HLL_MAGIC:
+            raise ValueError("Datos que no son un HyperLogLog")
+        hll = cls(precision, seed)
+        hll.registers = bytearray(data[HLL_HEADER.size:HLL_HEADER.size + (1 << precision)])
+        return hll
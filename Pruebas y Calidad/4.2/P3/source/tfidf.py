@@ -0,0 +1,82 @@
+"""
+Frecuencia documental y TF-IDF para Word Count - Actividad 4.2 Ejercicio 3.
+
+Cada documento se guarda como dos arreglos tipados paralelos (ids de
+palabra ordenados y conteos) sobre un vocabulario compartido, así la
+memoria es proporcional a las entradas distintas de cero. La frecuencia
+documental (DF) se actualiza al agregar cada documento.
+"""
+
+import heapq
+import math
+from array import array
+
+
+class TermDocumentMatrix:
+    """
+    Matriz documento x término dispersa con DF incremental.
+
+    TF = conteo / total de palabras del documento.
+    IDF = ln(N / DF); un término presente en todos los documentos pesa 0.
+    """
+
+    __slots__ = ("word_ids", "words", "document_frequency", "documents")
+
+    def __init__(self):
+        """Crea una matriz vacía."""
+        self.word_ids = {}
+        self.words = []
+        self.document_frequency = array('I')
+        # Por documento: (nombre, ids ordenados, conteos, total de palabras)
+        self.documents = []
+
+    def add_document(self, name, word_count):
+        """
+        Agrega un documento a partir de su diccionario palabra -> conteo.
+
+        El diccionario puede descartarse después: solo se guardan los arreglos.
+        """
+        word_ids = self.word_ids
+        words = self.words
+        document_frequency = self.document_frequency
+        pairs = []
+        for word, count in word_count.items():
+            word_id = word_ids.get(word)
+            if word_id is None:
+                word_id = word_ids[word] = len(words)
+                words.append(word)
+                document_frequency.append(0)
+            document_frequency[word_id] += 1
+            pairs.append((word_id, count))
+        pairs.sort()
+        self.documents.append((
+            name,
+            array('I', (word_id for word_id, _ in pairs)),
+            array('Q', (count for _, count in pairs)),
+            sum(count for _, count in pairs),
+        ))
+
+    def idf(self, word_id):
+        """IDF del término: ln(N / DF)."""
+        return math.log(len(self.documents) / self.document_frequency[word_id])
+
+    def top_terms(self, document_index, k):
+        """
+        Términos con mayor TF-IDF de un documento.
+
+        Returns:
+            Lista de (palabra, conteo, DF, TF-IDF) por TF-IDF descendente y
+            palabra ascendente, de longitud <= k.
+        """
+        _, ids, counts, total = self.documents[document_index]
+        words = self.words
+        document_frequency = self.document_frequency
+        idf = self.idf
+        rows = ((words[word_id], count, document_frequency[word_id],
+                 count / total * idf(word_id))
+                for word_id, count in zip(ids, counts))
+        return heapq.nsmallest(k, rows, key=lambda row: (-row[3], row[0]))
+
+    def nonzero_entries(self):
+        """Número total de entradas distintas de cero."""
+        return sum(len(ids) for _, ids, _, _ in self.documents)
@@ -0,0 +1,138 @@
+"""
+Tokenización por bloques para Word Count - Actividad 4.2 Ejercicio 3.
+
+Funciones compartidas por todos los modos de conteo: leer un archivo en
+bloques de líneas completas, separar palabras con str.split() y sumar
+conteos en un diccionario, sobre texto o sobre bytes mapeados con mmap.
+"""
+
+import sys
+
+# Tamaño aproximado (en caracteres) de cada bloque de líneas a tokenizar
+READ_BLOCK_SIZE = 1 << 20
+
+# Errores de lectura de un archivo de entrada que terminan el programa
+READ_ERRORS = (FileNotFoundError, PermissionError, UnicodeDecodeError)
+
+
+def exit_on_read_error(file_path, error):
+    """
+    Reporta un error de lectura (uno de READ_ERRORS) y termina con código 1.
+
+    Args:
+        file_path: Ruta del archivo que no se pudo leer.
+        error: Excepción capturada.
+    """
+    if isinstance(error, FileNotFoundError):
+        print(f"Error: Archivo '{file_path}' no encontrado.")
+    elif isinstance(error, PermissionError):
+        print(f"Error: Sin permiso para leer archivo '{file_path}'.")
+    else:
+        print(f"Error: Archivo '{file_path}' no es texto UTF-8.")
+    sys.exit(1)
+
+
+def extract_words(line):
+    """
+    Extrae palabras de una línea, separando por espacios en blanco.
+
+    str.split() sin argumentos separa con el mismo criterio que str.isspace()
+    (incluye espacios Unicode) y lo hace en C, sin recorrer carácter por
+    carácter en Python.
+
+    Args:
+        line: Cadena que contiene texto.
+
+    Returns:
+        Lista de palabras (cadenas) encontradas en la línea.
+    """
+    return line.split()
+
+
+def iter_word_blocks(file, block_size=READ_BLOCK_SIZE):
+    """
+    Lee el archivo en bloques de líneas completas y los tokeniza.
+
+    Ninguna palabra cruza un salto de línea, así que unir las líneas de un
+    bloque y separarlo de una vez da el mismo resultado que línea por línea.
+
+    Args:
+        file: Archivo de texto abierto.
+        block_size: Tamaño aproximado de cada bloque en caracteres.
+
+    Yields:
+        Listas de palabras, una por bloque.
+    """
+    while True:
+        lines = file.readlines(block_size)
+        if not lines:
+            return
+        yield extract_words(''.join(lines))
+
+
+def iter_file_words(file_path, by_line=False):
+    """
+    Tokeniza un archivo por bloques, reportando errores de lectura.
+
+    Args:
+        file_path: Ruta al archivo que contiene texto.
+        by_line: Si es True, entrega (número_línea, palabras) por línea.
+
+    Yields:
+        Listas de palabras, una por bloque (o tuplas por línea con by_line).
+    """
+    try:
+        with open(file_path, 'r', encoding='utf-8') as file:
+            if by_line:
+                for line_number, line in enumerate(file, 1):
+                    yield line_number, extract_words(line)
+            else:
+                yield from iter_word_blocks(file)
+
+    except READ_ERRORS as err:
+        exit_on_read_error(file_path, err)
+
+
+def count_words(words, word_count):
+    """Suma cada palabra de words en el diccionario word_count."""
+    for word in words:
+        word_count[word] = word_count.get(word, 0) + 1
+
+
+def iter_mmap_blocks(mapped, block_size=READ_BLOCK_SIZE):
+    """
+    Corta un archivo mapeado en bloques de bytes que terminan en salto de línea.
+
+    Yields:
+        Bloques (bytes) de aproximadamente block_size bytes.
+    """
+    size = len(mapped)
+    start = 0
+    while start < size:
+        end = mapped.find(b'\n', min(start + block_size, size))
+        end = size if end < 0 else end + 1
+        yield mapped[start:end]
+        start = end
+
+
+def decode_byte_counts(byte_count):
+    """
+    Convierte conteos con llaves bytes a llaves str, una vez por palabra distinta.
+
+    bytes.split() solo separa por espacios ASCII; str.split() también separa
+    por espacios Unicode (p. ej. U+00A0, U+3000) y por \\x1c-\\x1f. Cada
+    palabra distinta se vuelve a separar tras decodificarla, así el resultado
+    es idéntico al de la ruta de texto.
+
+    Returns:
+        Diccionario palabra (str) -> conteo.
+    """
+    word_count = {}
+    for token, count in byte_count.items():
+        text = token.decode('utf-8')
+        if text.isascii() and text.isprintable():
+            word_count[text] = word_count.get(text, 0) + count
+            continue
+        for word in text.split():
+            word_count[word] = word_count.get(word, 0) + count
+    return word_count
@@ -0,0 +1,128 @@
+"""
+Vocabulario compacto para Word Count - Actividad 4.2 Ejercicio 3.
+
+Alternativa al diccionario palabra -> conteo para vocabularios de millones
+de palabras: los bytes UTF-8 de las palabras viven contiguos en un arena
+(bytearray), un índice hash de direccionamiento abierto guarda posiciones
+y los conteos van en un arreglo tipado. No hay un objeto str ni int por
+palabra mientras se cuenta.
+"""
+
+from array import array
+
+# Capacidad inicial del índice (potencia de 2) y carga máxima (1/2)
+INITIAL_SLOTS = 1024
+
+
+class CompactVocabulary:
+    """
+    Conteo de palabras con almacenamiento contiguo.
+
+    Ofrece items(), values(), get() y len() como un dict, así que
+    sort_words_by_frequency_then_name y --top funcionan sin cambios.
+    """
+
+    __slots__ = ("arena", "offsets", "counts", "hashes", "index", "mask", "size")
+
+    def __init__(self, slots=INITIAL_SLOTS):
+        """Crea un vocabulario vacío con slots posiciones (potencia de 2)."""
+        self.arena = bytearray()
+        # offsets[i]:offsets[i + 1] delimita la palabra i en el arena
+        self.offsets = array('Q', [0])
+        self.counts = array('Q')
+        self.hashes = array('q')
+        # Índice: 0 = vacío, i + 1 = palabra i
+        self.index = array('q', bytes(8 * slots))
+        self.mask = slots - 1
+        self.size = 0
+
+    def _find(self, key, key_hash):
+        """
+        Busca key con sondeo lineal.
+
+        Returns:
+            Tupla (posición en el índice, id de la palabra o -1 si no existe).
+        """
+        index = self.index
+        hashes = self.hashes
+        offsets = self.offsets
+        arena = self.arena
+        slot = key_hash & self.mask
+        while True:
+            entry = index[slot]
+            if not entry:
+                return slot, -1
+            word_id = entry - 1
+            if (hashes[word_id] == key_hash
+                    and arena[offsets[word_id]:offsets[word_id + 1]] == key):
+                return slot, word_id
+            slot = (slot + 1) & self.mask
+
+    def add(self, word, count=1):
+        """Suma count ocurrencias de word."""
+        key = word.encode('utf-8')
+        key_hash = hash(key)
+        slot, word_id = self._find(key, key_hash)
+        if word_id >= 0:
+            self.counts[word_id] += count
+            return
+        self.arena += key
+        self.offsets.append(len(self.arena))
+        self.counts.append(count)
+        self.hashes.append(key_hash)
+        self.size += 1
+        self.index[slot] = self.size
+        if 2 * self.size > len(self.index):
+            self._grow()
+
+    def update(self, word_count):
+        """Suma un diccionario palabra -> conteo (p. ej. el de un bloque)."""
+        add = self.add
+        for word, count in word_count.items():
+            add(word, count)
+
+    def _grow(self):
+        """Duplica el índice y reinserta usando los hashes guardados."""
+        slots = 2 * len(self.index)
+        index = array('q', bytes(8 * slots))
+        mask = slots - 1
+        for word_id, key_hash in enumerate(self.hashes):
+            slot = key_hash & mask
+            while index[slot]:
+                slot = (slot + 1) & mask
+            index[slot] = word_id + 1
+        self.index = index
+        self.mask = mask
+
+    def word(self, word_id):
+        """Palabra (str) con el id indicado."""
+        return self.arena[self.offsets[word_id]:self.offsets[word_id + 1]].decode('utf-8')
+
+    def get(self, word, default=None):
+        """Conteo de word, o default si no está."""
+        key = word.encode('utf-8')
+        _, word_id = self._find(key, hash(key))
+        return self.counts[word_id] if word_id >= 0 else default
+
+    def items(self):
+        """Pares (palabra, conteo) en orden de inserción."""
+        word = self.word
+        counts = self.counts
+        for word_id in range(self.size):
+            yield word(word_id), counts[word_id]
+
+    def values(self):
+        """Conteos en orden de inserción."""
+        return iter(self.counts)
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, word):
+        return self.get(word) is not None
+
+    def nbytes(self):
+        """Bytes ocupados por los buffers (arena, offsets, conteos, hashes, índice)."""
+        return (len(self.arena)
+                + sum(len(buffer) * buffer.itemsize
+                      for buffer in (self.offsets, self.counts, self.hashes, self.index)))
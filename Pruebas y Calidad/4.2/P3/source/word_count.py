@@ -5,80 +5,227 @@ Este programa lee texto de un archivo y cuenta la frecuencia de cada
 palabra distinta usando algoritmos básicos sin librerías externas.
 
 Invocación: python word_count.py archivo_con_datos.txt
+           python word_count.py archivo1.txt carpeta/ "logs/*.txt"  (corpus)
 """
 
+import glob
+import heapq
+import itertools
+import mmap
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import Pool
+
+from external_sort import SpillingWordCounter
+from incremental import read_words_incremental
+from inverted_index import IndexBuilder, InvertedIndex
+from ngrams import read_ngrams
+from normalization import NORMALIZATION_STEPS, TokenNormalizer, load_stopwords
+from parallel_count import (count_byte_range, map_byte_ranges, merge_word_counts,
+                            read_cardinality, read_words_approx, worker_ranges)
+from results_format import STRUCTURED_FORMATS, BinaryResults, write_structured
+from sketches import ApproximateWordCounter, HyperLogLog
+from tfidf import TermDocumentMatrix
+from tokenizer import (READ_ERRORS, count_words, decode_byte_counts, exit_on_read_error,
+                       iter_file_words, iter_mmap_blocks)
+from vocabulary import CompactVocabulary
+
+# Hilos de lectura en modo corpus (traslapan la E/S de varios archivos)
+CORPUS_READ_THREADS = 8
+
+# Máximo de archivos para la tabla dinámica en modo corpus; con más, el
+# reporte usa una fila por (palabra, archivo) con conteo
+CORPUS_PIVOT_MAX_FILES = 50
+
+# Carpeta de reportes: {TC}.Results.txt, índices, checkpoints, etc.
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "results")
 
 
-def extract_words(line):
+def read_words_from_file(file_path):
     """
-    Extrae palabras de una línea, separando por espacios en blanco.
+    Lee todas las palabras de un archivo, manejando errores correctamente.
 
     Args:
-        line: Cadena que contiene texto.
+        file_path: Ruta al archivo que contiene texto.
 
     Returns:
-        Lista de palabras (cadenas) encontradas en la línea.
+        Tupla de (diccionario_frecuencia_palabras, contador_errores).
+        Las líneas inválidas se reportan en consola.
     """
-    words = []
-    current_word = []
-    for char in line:
-        if char.isspace():
-            if current_word:
-                words.append(''.join(current_word))
-                current_word = []
-        else:
-            current_word.append(char)
-    if current_word:
-        words.append(''.join(current_word))
-    return words
+    # Diccionario: palabra -> conteo (algoritmo básico, sin Counter)
+    word_count = {}
+    error_count = 0
 
+    for words in iter_file_words(file_path):
+        # split() nunca produce palabras vacías; las líneas en blanco
+        # simplemente no aportan palabras
+        count_words(words, word_count)
 
-def read_words_from_file(file_path):
+    return word_count, error_count
+
+
+def read_words_compact(file_path):
     """
-    Lee todas las palabras de un archivo, manejando errores correctamente.
+    Igual que read_words_from_file, pero con un CompactVocabulary.
 
-    Args:
-        file_path: Ruta al archivo que contiene texto.
+    Cada bloque se cuenta en un diccionario temporal y luego se vuelca al
+    vocabulario compacto, así el costo de memoria por palabra distinta es
+    el del arena y los arreglos tipados, no el de un dict.
+
+    Returns:
+        Tupla de (CompactVocabulary, contador_errores).
+    """
+    vocabulary = CompactVocabulary()
+    for words in iter_file_words(file_path):
+        block_count = {}
+        count_words(words, block_count)
+        vocabulary.update(block_count)
+    return vocabulary, 0
+
+
+def read_words_bytes(file_path):
+    """
+    Cuenta palabras sobre bytes con mmap, decodificando solo palabras distintas.
+
+    Evita decodificar cada línea y crear un str por ocurrencia; el resultado
+    es idéntico al de read_words_from_file.
 
     Returns:
         Tupla de (diccionario_frecuencia_palabras, contador_errores).
-        Las líneas inválidas se reportan en consola.
     """
-    # Diccionario: palabra -> conteo (algoritmo básico, sin Counter)
+    byte_count = {}
+    try:
+        with open(file_path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size > 0:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    for block in iter_mmap_blocks(mapped):
+                        count_words(block.split(), byte_count)
+        word_count = decode_byte_counts(byte_count)
+
+    except READ_ERRORS as err:
+        exit_on_read_error(file_path, err)
+    return word_count, 0
+
+
+def read_words_indexed(file_path):
+    """
+    Cuenta palabras y a la vez construye el índice invertido palabra -> líneas.
+
+    Recorre línea por línea (más lento que por bloques) porque necesita el
+    número de línea de cada palabra.
+
+    Returns:
+        Tupla (diccionario_frecuencia_palabras, IndexBuilder).
+    """
     word_count = {}
-    line_number = 0
-    error_count = 0
+    builder = IndexBuilder()
+    for line_number, words in iter_file_words(file_path, by_line=True):
+        count_words(words, word_count)
+        builder.add_line(line_number, words)
+    return word_count, builder
+
+
+def read_words_parallel(file_path, workers):
+    """
+    Cuenta palabras en paralelo (map-reduce) repartiendo rangos de bytes.
+
+    Args:
+        file_path: Ruta al archivo que contiene texto.
+        workers: Número de procesos.
+
+    Returns:
+        Tupla de (diccionario_frecuencia_palabras, contador_errores), igual
+        que read_words_from_file.
+    """
+    ranges = worker_ranges(file_path, workers)
+
+    if workers <= 1 or len(ranges) <= 1:
+        return read_words_from_file(file_path)
+
+    tasks = [(file_path, start, end) for start, end in ranges]
+    partials = list(map_byte_ranges(count_byte_range, tasks, workers))
+
+    return merge_word_counts(partials), 0
+
+
+def expand_input_paths(args):
+    """
+    Expande archivos, carpetas (recursivo) y patrones glob a una lista de archivos.
+
+    Las rutas explícitas se conservan tal cual para que un archivo inexistente
+    se reporte al leerlo.
+
+    Args:
+        args: Rutas o patrones de la línea de comandos.
+
+    Returns:
+        Tupla (lista de archivos sin duplicados en orden, True si algún
+        argumento fue carpeta o patrón).
+    """
+    paths = []
+    expanded = False
+    for arg in args:
+        if os.path.isdir(arg):
+            expanded = True
+            for root, dirs, files in os.walk(arg):
+                # Omitir archivos y carpetas ocultos (.gitkeep, .git, ...)
+                dirs[:] = sorted(name for name in dirs if not name.startswith('.'))
+                paths.extend(os.path.join(root, name) for name in sorted(files)
+                             if not name.startswith('.'))
+        elif glob.has_magic(arg):
+            expanded = True
+            paths.extend(path for path in sorted(glob.glob(arg, recursive=True))
+                         if os.path.isfile(path))
+        else:
+            paths.append(arg)
+    return list(dict.fromkeys(paths)), expanded
+
+
+def _read_in_worker(task):
+    """
+    Ejecuta reader(file_path) en un proceso del Pool.
 
+    Los lectores terminan con sys.exit(1) tras reportar un archivo inválido;
+    dentro del Pool eso mataría al proceso y pool.map nunca regresaría, así
+    que el error se convierte en None y el proceso padre termina.
+    """
+    reader, file_path = task
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            for line in file:
-                line_number += 1
-                stripped_line = line.strip()
+        return reader(file_path)
+    except SystemExit:
+        return None
 
-                # Saltar líneas vacías (no es error)
-                if not stripped_line:
-                    continue
 
-                words = extract_words(stripped_line)
+def read_corpus(file_paths, workers=1, reader=None):
+    """
+    Cuenta palabras de varios archivos en una sola invocación.
 
-                for word in words:
-                    # Validar: la palabra debe contener al menos una letra/dígito
-                    if not word:
-                        continue
-                    # Contar la palabra
-                    word_count[word] = word_count.get(word, 0) + 1
+    Con workers > 1 reparte los archivos en procesos; si no, los lee con un
+    grupo de hilos para traslapar la E/S.
 
-    except FileNotFoundError:
-        print(f"Error: Archivo '{file_path}' no encontrado.")
-        sys.exit(1)
-    except PermissionError:
-        print(f"Error: Sin permiso para leer archivo '{file_path}'.")
-        sys.exit(1)
+    Args:
+        file_paths: Lista de rutas.
+        workers: Número de procesos.
+        reader: Función de lectura por archivo (por defecto read_words_from_file).
 
-    return word_count, error_count
+    Returns:
+        Tupla (lista de diccionarios por archivo en el mismo orden,
+        diccionario agregado del corpus).
+    """
+    reader = reader or read_words_from_file
+    if workers > 1:
+        with Pool(processes=workers) as pool:
+            results = pool.map(_read_in_worker, [(reader, path) for path in file_paths])
+        if None in results:
+            # El proceso ya reportó el error del archivo
+            sys.exit(1)
+    else:
+        with ThreadPoolExecutor(max_workers=CORPUS_READ_THREADS) as executor:
+            results = list(executor.map(reader, file_paths))
+    per_file = [word_count for word_count, _ in results]
+    return per_file, merge_word_counts(per_file, copy=True)
 
 
 def sort_words_by_frequency_then_name(word_count):
@@ -96,6 +243,30 @@ def sort_words_by_frequency_then_name(word_count):
     return sorted(word_count.items(), key=lambda x: (-x[1], x[0]))
 
 
+def top_words_by_frequency_then_name(word_count, k):
+    """
+    Selecciona las k palabras más frecuentes sin ordenar todo el vocabulario.
+
+    heapq.nsmallest mantiene un heap de tamaño k: O(n log k) en lugar de
+    O(n log n). Usa el mismo desempate que sort_words_by_frequency_then_name.
+
+    Args:
+        word_count: Diccionario que mapea palabra a conteo.
+        k: Número de palabras a regresar.
+
+    Returns:
+        Lista de tuplas (palabra, conteo), ordenadas, de longitud <= k.
+    """
+    return heapq.nsmallest(k, word_count.items(), key=lambda x: (-x[1], x[0]))
+
+
+def _rank_words(word_count, top):
+    """Ordena todo el vocabulario, o solo las top primeras si top no es None."""
+    if top is None:
+        return sort_words_by_frequency_then_name(word_count)
+    return top_words_by_frequency_then_name(word_count, top)
+
+
 def _get_tc_name(file_path):
     """Extrae nombre del TC del nombre del archivo (ej: TC1.txt -> TC1)."""
     base = os.path.basename(file_path)
@@ -103,55 +274,704 @@ def _get_tc_name(file_path):
     return name
 
 
-def main():
-    """Punto de entrada principal del programa de conteo de palabras."""
-    if len(sys.argv) < 2:
-        print("Uso: python word_count.py archivo_con_datos.txt")
-        sys.exit(1)
-
-    # Ruta del archivo desde argumento de línea de comandos
-    input_file = sys.argv[1]
-    tc_name = _get_tc_name(input_file)
-    # Escribir salida en carpeta results: {TC_name}.Results.txt
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    output_file = os.path.join(script_dir, "..", "results", f"{tc_name}.Results.txt")
-
-    # Iniciar cronometraje
-    start_time = time.time()
-
-    # Leer y contar palabras
-    word_count, _ = read_words_from_file(input_file)
+def format_results(tc_name, sorted_words, elapsed_time, total_count=None):
+    """
+    Genera las líneas del reporte con el formato de TC1.Results.
 
-    # Ordenar: por frecuencia descendente, luego por palabra ascendente
-    sorted_words = sort_words_by_frequency_then_name(word_count)
+    Formato: Row Labels, Count of TCn, (blank), Grand Total, TIME ELAPSED.
 
-    # Finalizar cronometraje
-    elapsed_time = time.time() - start_time
+    Args:
+        tc_name: Nombre del caso de prueba.
+        sorted_words: Lista de (palabra, conteo) ya ordenada.
+        elapsed_time: Tiempo de ejecución en segundos.
+        total_count: Grand Total; si es None se suma sorted_words (con --top
+            se pasa el total de todo el vocabulario).
 
-    # Formato como TC1.Results: Row Labels, Count of TCn, (blank), Grand Total
+    Returns:
+        Lista de cadenas.
+    """
     header = f"Row Labels\tCount of {tc_name}"
     results = []
-    total_count = 0
 
     for word, count in sorted_words:
         results.append(f"{word}\t{count}")
-        total_count += count
+
+    if total_count is None:
+        total_count = sum(count for _, count in sorted_words)
 
     blank_line = "(blank)\t"
     grand_total_line = f"Grand Total\t{total_count}"
     time_line = f"TIME ELAPSED\t{elapsed_time:.6f} seconds"
 
-    output_lines = [header] + results + [blank_line, grand_total_line, time_line]
+    return [header] + results + [blank_line, grand_total_line, time_line]
 
-    # Escribir en archivo
+
+def stream_results(output_file, tc_name, sorted_words, total_count, start_time):
+    """
+    Escribe y muestra el reporte de format_results línea por línea.
+
+    Para el modo con presupuesto de memoria: sorted_words es un iterador
+    (mezcla externa) que nunca se materializa en una lista. TIME ELAPSED
+    incluye la mezcla final, porque ocurre mientras se escribe.
+    """
     with open(output_file, 'w', encoding='utf-8') as file:
-        for line in output_lines:
+        def emit(line):
             file.write(line + '\n')
+            print(line)
 
-    # Imprimir en consola
-    for line in output_lines:
+        emit(f"Row Labels\tCount of {tc_name}")
+        for word, count in sorted_words:
+            emit(f"{word}\t{count}")
+        emit("(blank)\t")
+        emit(f"Grand Total\t{total_count}")
+        emit(f"TIME ELAPSED\t{time.time() - start_time:.6f} seconds")
+
+
+def read_words_spilling(file_path, budget_bytes):
+    """
+    Cuenta palabras con memoria acotada, volcando runs ordenados a disco.
+
+    Returns:
+        SpillingWordCounter listo para sorted_by_frequency(); el llamador
+        debe cerrarlo (close) para borrar los temporales.
+    """
+    counter = SpillingWordCounter(budget_bytes)
+    try:
+        for words in iter_file_words(file_path):
+            counter.add_words(words)
+    except BaseException:
+        counter.close()
+        raise
+    return counter
+
+
+def _corpus_postings(per_file, sorted_words):
+    """
+    Conteos por archivo de las palabras del reporte, en una pasada por archivo.
+
+    Cada archivo se recorre por el lado más pequeño (su diccionario o las
+    palabras del reporte), así el costo es proporcional a las celdas con
+    conteo y no a palabras × archivos.
+
+    Returns:
+        Tupla (diccionario palabra -> lista de (índice_archivo, conteo) en
+        orden de archivo, lista de totales por archivo).
+    """
+    postings = {word: [] for word, _ in sorted_words}
+    file_totals = []
+    for index, counts in enumerate(per_file):
+        file_totals.append(sum(counts.values()))
+        if len(counts) < len(postings):
+            for word, count in counts.items():
+                if word in postings:
+                    postings[word].append((index, count))
+        else:
+            for word, cells in postings.items():
+                count = counts.get(word)
+                if count is not None:
+                    cells.append((index, count))
+    return postings, file_totals
+
+
+def format_corpus_results(names, per_file, sorted_words, elapsed_time, grand_total=None):
+    """
+    Genera una tabla dinámica: una columna por archivo y Grand Total.
+
+    Las celdas sin ocurrencias quedan vacías, como en la tabla de Excel. Con
+    más de CORPUS_PIVOT_MAX_FILES archivos la tabla sería casi toda celdas
+    vacías, así que se escribe una fila "palabra, archivo, conteo" por celda
+    con conteo, seguida de la fila Grand Total de la palabra.
+
+    Args:
+        names: Nombre de columna de cada archivo.
+        per_file: Diccionarios palabra -> conteo por archivo.
+        sorted_words: Lista agregada (palabra, conteo) ya ordenada.
+        elapsed_time: Tiempo de ejecución en segundos.
+        grand_total: Total del corpus; si es None se suma sorted_words.
+
+    Returns:
+        Lista de cadenas.
+    """
+    postings, file_totals = _corpus_postings(per_file, sorted_words)
+    if grand_total is None:
+        grand_total = sum(count for _, count in sorted_words)
+
+    if len(names) > CORPUS_PIVOT_MAX_FILES:
+        lines = ["Row Labels\tFile\tCount"]
+        for word, count in sorted_words:
+            lines.extend(f"{word}\t{names[index]}\t{file_count}"
+                         for index, file_count in postings[word])
+            lines.append(f"{word}\tGrand Total\t{count}")
+        lines.extend(f"Grand Total\t{name}\t{total}" for name, total in zip(names, file_totals))
+        lines.append(f"Grand Total\tGrand Total\t{grand_total}")
+        lines.append(f"TIME ELAPSED\t{elapsed_time:.6f} seconds")
+        return lines
+
+    lines = ["Row Labels\t" + "\t".join(names) + "\tGrand Total"]
+    empty = [""] * len(names)
+    for word, count in sorted_words:
+        cells = list(empty)
+        for index, file_count in postings[word]:
+            cells[index] = str(file_count)
+        lines.append(f"{word}\t" + "\t".join(cells) + f"\t{count}")
+
+    lines.append("(blank)" + "\t" * (len(names) + 1))
+    lines.append("Grand Total\t" + "\t".join(map(str, file_totals)) + f"\t{grand_total}")
+    lines.append(f"TIME ELAPSED\t{elapsed_time:.6f} seconds")
+    return lines
+
+
+def format_ngram_results(tc_name, counter, elapsed_time, top=None):
+    """
+    Genera una tabla por tamaño de n-grama, con el formato de format_results.
+
+    Las tablas se separan con líneas en blanco. Si hubo poda, una línea
+    PRUNED indica el umbral: los n-gramas con conteo <= umbral pudieron
+    eliminarse y los restantes pueden subestimar hasta ese valor. Grand
+    Total cuenta todos los n-gramas vistos.
+
+    Returns:
+        Lista de cadenas.
+    """
+    lines = []
+    for n in counter.sizes:
+        table = counter.tables[n]
+        if lines:
+            lines.extend(["", "", ""])
+        section = format_results(f"{tc_name} ({n}-grams)",
+                                 _rank_words(counter.as_words(n), top),
+                                 elapsed_time, table.total)
+        if table.prune_floor:
+            section.insert(-1, f"PRUNED\tcount<={table.prune_floor}")
+        lines.extend(section[:-1])
+    lines.append(f"TIME ELAPSED\t{elapsed_time:.6f} seconds")
+    return lines
+
+
+def read_term_document_matrix(file_paths, names, reader=None, normalizer=None):
+    """
+    Construye la matriz dispersa documento x término de un corpus.
+
+    Los documentos se leen de uno en uno: el diccionario de cada documento
+    se convierte a arreglos sobre el vocabulario compartido y se libera,
+    así la memoria depende de las entradas distintas de cero.
+
+    Returns:
+        TermDocumentMatrix con los conteos y la DF de cada término.
+    """
+    reader = reader or read_words_from_file
+    matrix = TermDocumentMatrix()
+    for file_path, name in zip(file_paths, names):
+        word_count, _ = reader(file_path)
+        if normalizer is not None:
+            word_count = normalizer.fold(word_count)
+        matrix.add_document(name, word_count)
+    return matrix
+
+
+def format_tfidf_results(matrix, top, elapsed_time):
+    """
+    Genera una tabla de términos con mayor TF-IDF por documento.
+
+    Columnas: palabra, conteo en el documento, DF y TF-IDF. Las tablas se
+    separan con líneas en blanco, como en el reporte de convert_numbers.
+
+    Returns:
+        Lista de cadenas.
+    """
+    lines = []
+    for index, (name, _, _, total) in enumerate(matrix.documents):
+        if lines:
+            lines.extend(["", "", ""])
+        lines.append(f"Row Labels\tCount of {name}\tDF\tTF-IDF")
+        for word, count, frequency, weight in matrix.top_terms(index, top):
+            lines.append(f"{word}\t{count}\t{frequency}\t{weight:.6f}")
+        lines.append("(blank)\t\t\t")
+        lines.append(f"Grand Total\t{total}")
+    lines.extend([
+        "",
+        f"DOCUMENTS\t{len(matrix.documents)}",
+        f"VOCABULARY\t{len(matrix.words)}",
+        f"NONZERO\t{matrix.nonzero_entries()}",
+        f"TIME ELAPSED\t{elapsed_time:.6f} seconds",
+    ])
+    return lines
+
+
+def format_cardinality_results(tc_name, hll, total_count, elapsed_time):
+    """
+    Genera el reporte del modo cardinalidad (solo número de palabras distintas).
+
+    Returns:
+        Lista de cadenas.
+    """
+    return [
+        f"Row Labels\tCount of {tc_name}",
+        f"DISTINCT WORDS (approx)\t{round(hll.estimate())}",
+        f"STANDARD ERROR\t{100 * hll.standard_error():.2f}%\t"
+        f"precision={hll.precision}\t{len(hll.registers)} bytes",
+        f"Grand Total\t{total_count}",
+        f"TIME ELAPSED\t{elapsed_time:.6f} seconds",
+    ]
+
+
+def format_approx_results(tc_name, counter, elapsed_time, top=None):
+    """
+    Genera el reporte del modo aproximado.
+
+    Mismo formato que format_results con conteos estimados de las palabras
+    más frecuentes, más una línea ERROR BOUND: cada conteo sobreestima a lo
+    más ese valor con la probabilidad indicada. Grand Total es exacto.
+
+    Returns:
+        Lista de cadenas.
+    """
+    lines = format_results(f"{tc_name} (approx)", counter.top(top), elapsed_time,
+                           counter.total)
+    sketch = counter.sketch
+    lines.insert(-1, f"ERROR BOUND\t+{counter.error_bound():.1f}\t"
+                     f"p={1 - sketch.delta:.4f}\twidth={sketch.width}\tdepth={sketch.depth}")
+    return lines
+
+
+def _column_names(file_paths):
+    """Nombres de columna por archivo; usa la ruta si los nombres TC se repiten."""
+    names = [_get_tc_name(path) for path in file_paths]
+    if len(set(names)) < len(names):
+        return list(file_paths)
+    return names
+
+
+def parse_options(args):
+    """
+    Separa opciones (--nombre o --nombre=valor) de los archivos de entrada.
+
+    Returns:
+        Tupla (diccionario opción -> valor, lista de archivos).
+    """
+    options = {}
+    files = []
+    for arg in args:
+        if arg.startswith("--"):
+            name, _, value = arg[2:].partition("=")
+            options[name] = value or True
+        else:
+            files.append(arg)
+    return options, files
+
+
+def _build_normalizer(options):
+    """
+    Crea el TokenNormalizer pedido con --normalize y --stopwords, o None.
+
+    --normalize acepta una lista separada por comas (nfkc,casefold,punct)
+    o sin valor para aplicar todos los pasos.
+    """
+    if "normalize" not in options and "stopwords" not in options:
+        return None
+    steps = options.get("normalize", "")
+    steps = NORMALIZATION_STEPS if steps is True else [s for s in steps.split(",") if s]
+    stopwords = ()
+    if "stopwords" in options:
+        if options["stopwords"] is True:
+            print("Error: --stopwords requiere la ruta de un archivo.")
+            sys.exit(1)
+        stopwords = load_stopwords(options["stopwords"])
+    try:
+        return TokenNormalizer(steps, stopwords)
+    except ValueError as err:
+        print(f"Error: {err}")
+        sys.exit(1)
+
+
+def query_index(index_path, words):
+    """
+    Responde dónde aparece cada palabra usando un índice ya construido.
+
+    Returns:
+        Lista de cadenas: palabra, conteo y números de línea.
+    """
+    try:
+        index = InvertedIndex(index_path)
+    except FileNotFoundError:
+        print(f"Error: Índice '{index_path}' no encontrado.")
+        sys.exit(1)
+    except ValueError as err:
+        print(f"Error: {err}")
+        sys.exit(1)
+    lines = ["Word\tCount\tLines"]
+    with index:
+        for word in words:
+            line_numbers, count = index.lookup(word)
+            lines.append(f"{word}\t{count}\t{','.join(map(str, line_numbers))}")
+    return lines
+
+
+def query_results(results_path, words):
+    """
+    Consulta conteos en un resultado binario (--format=binary) sin parsearlo.
+
+    Returns:
+        Lista de cadenas: palabra y conteo (0 si no aparece).
+    """
+    try:
+        results = BinaryResults(results_path)
+    except FileNotFoundError:
+        print(f"Error: Resultado '{results_path}' no encontrado.")
+        sys.exit(1)
+    except ValueError as err:
+        print(f"Error: {err}")
+        sys.exit(1)
+    lines = ["Word\tCount"]
+    with results:
+        for word in words:
+            lines.append(f"{word}\t{results.get(word, 0)}")
+    return lines
+
+
+def _int_option(options, name, default):
+    """Lee una opción entera positiva; termina con error si es inválida."""
+    value = options.get(name, default)
+    if value is True or not str(value).isdigit() or int(value) < 1:
+        print(f"Error: --{name} requiere un entero positivo.")
+        sys.exit(1)
+    return int(value)
+
+
+# Opciones que admite el conteo exacto de palabras (reporte {TC}.Results.txt)
+EXACT_OPTIONS = ("top", "format", "normalize", "stopwords")
+
+
+class RunSettings:
+    """Opciones ya validadas de una corrida, compartidas por los modos de main."""
+
+    __slots__ = ("options", "input_files", "corpus_mode", "workers", "top", "normalizer",
+                 "start_time")
+
+    def __init__(self, options, input_files, corpus_mode):
+        """
+        Args:
+            options: Diccionario opción -> valor de parse_options.
+            input_files: Archivos de entrada ya expandidos.
+            corpus_mode: Si se cuentan varios archivos como corpus.
+        """
+        self.options = options
+        self.input_files = input_files
+        self.corpus_mode = corpus_mode
+        self.workers = _int_option(options, "workers", 1)
+        self.top = _int_option(options, "top", 1) if "top" in options else None
+        self.normalizer = _build_normalizer(options)
+        output_format = options.get("format")
+        if output_format is not None and output_format not in STRUCTURED_FORMATS:
+            print(f"Error: --format acepta {', '.join(STRUCTURED_FORMATS)}.")
+            sys.exit(1)
+        # Iniciar cronometraje
+        self.start_time = time.time()
+
+    def name(self):
+        """Nombre del reporte: "Corpus" o el nombre TC del único archivo."""
+        return "Corpus" if self.corpus_mode else _get_tc_name(self.input_files[0])
+
+    def result_path(self, file_name):
+        """Ruta de file_name dentro de la carpeta results."""
+        return os.path.join(RESULTS_DIR, file_name)
+
+    def elapsed(self):
+        """Segundos transcurridos desde el inicio del cronometraje."""
+        return time.time() - self.start_time
+
+
+def run_memory_budget(run):
+    """
+    --memory-budget=MB: volcado a disco y mezcla externa.
+
+    Escribe el reporte en streaming, así que no devuelve líneas (None).
+    """
+    budget_bytes = _int_option(run.options, "memory-budget", 1) << 20
+    tc_name = run.name()
+    output_file = run.result_path(f"{tc_name}.Results.txt")
+    with read_words_spilling(run.input_files[0], budget_bytes) as counter:
+        ranked = counter.sorted_by_frequency()
+        if run.top is not None:
+            # Ya viene en el orden final: basta con las primeras K
+            ranked = itertools.islice(ranked, run.top)
+        stream_results(output_file, tc_name, ranked, counter.total, run.start_time)
+
+
+def run_tfidf(run):
+    """--tfidf[=K]: TF-IDF por documento sobre el corpus (cada archivo es un documento)."""
+    tfidf_top = 10 if run.options["tfidf"] is True else _int_option(run.options, "tfidf", 10)
+    reader = read_words_bytes if "bytes" in run.options else read_words_from_file
+    matrix = read_term_document_matrix(run.input_files, _column_names(run.input_files),
+                                       reader, run.normalizer)
+    return (run.result_path("TfidfResults.txt"),
+            format_tfidf_results(matrix, tfidf_top, run.elapsed()))
+
+
+def run_cardinality(run):
+    """--cardinality[=P]: solo número de palabras distintas (HyperLogLog), combinando archivos."""
+    precision = run.options["cardinality"]
+    precision = 12 if precision is True else (int(precision) if precision.isdigit() else 0)
+    if not 4 <= precision <= 18:
+        print("Error: --cardinality acepta una precisión entre 4 y 18.")
+        sys.exit(1)
+    hll = HyperLogLog(precision)
+    total_count = 0
+    for input_file in run.input_files:
+        partial, partial_total = read_cardinality(input_file, precision, run.workers)
+        hll.merge(partial)
+        total_count += partial_total
+    name = run.name()
+    return (run.result_path(f"{name}.CardinalityResults.txt"),
+            format_cardinality_results(name, hll, total_count, run.elapsed()))
+
+
+def run_ngrams(run):
+    """--ngrams[=2,3]: una tabla de n-gramas por tamaño."""
+    sizes = run.options["ngrams"]
+    sizes = "2,3" if sizes is True else sizes
+    if not all(size.isdigit() and int(size) > 0 for size in sizes.split(",")):
+        print("Error: --ngrams acepta tamaños enteros separados por comas (p. ej. 2,3).")
+        sys.exit(1)
+    max_entries = (_int_option(run.options, "max-ngrams", 1)
+                   if "max-ngrams" in run.options else None)
+    counter = read_ngrams(run.input_files, [int(size) for size in sizes.split(",")],
+                          max_entries, run.normalizer)
+    name = run.name()
+    return (run.result_path(f"{name}.NgramResults.txt"),
+            format_ngram_results(name, counter, run.elapsed(), run.top))
+
+
+def run_approx(run):
+    """--approx: un sketch por archivo, combinados en uno solo."""
+    settings = (
+        _int_option(run.options, "width", 1 << 16),
+        _int_option(run.options, "depth", 4),
+        _int_option(run.options, "heavy-hitters", max(run.top or 0, 1000)),
+    )
+    counter = ApproximateWordCounter(*settings)
+    for input_file in run.input_files:
+        counter.merge(read_words_approx(input_file, settings, run.workers))
+    name = run.name()
+    return (run.result_path(f"{name}.ApproxResults.txt"),
+            format_approx_results(name, counter, run.elapsed(), run.top))
+
+
+def _report_word_count(run, word_count):
+    """
+    Reporte exacto de un solo archivo a partir de sus conteos.
+
+    Normaliza (una vez por palabra distinta), ordena por frecuencia
+    descendente y palabra ascendente (solo las K primeras con --top) y
+    escribe además el formato estructurado pedido con --format.
+
+    Returns:
+        Tupla (ruta del reporte, líneas del reporte).
+    """
+    tc_name = _get_tc_name(run.input_files[0])
+    if run.normalizer is not None:
+        word_count = run.normalizer.fold(word_count)
+    sorted_words = _rank_words(word_count, run.top)
+    total_count = sum(word_count.values())
+
+    # Conteos en formato estructurado: {TC_name}.Results.csv|jsonl|bin
+    output_format = run.options.get("format")
+    if output_format is not None:
+        write_structured(
+            run.result_path(f"{tc_name}.Results.{STRUCTURED_FORMATS[output_format]}"),
+            output_format, sorted_words, total_count
+        )
+    return (run.result_path(f"{tc_name}.Results.txt"),
+            format_results(tc_name, sorted_words, run.elapsed(), total_count))
+
+
+def _run_corpus(run, reader):
+    """Modo corpus: una sola tabla con columnas por archivo y agregado."""
+    per_file, word_count = read_corpus(run.input_files, run.workers, reader)
+    if run.normalizer is not None:
+        # La caché es compartida: cada palabra distinta se normaliza una vez
+        per_file = [run.normalizer.fold(counts) for counts in per_file]
+        word_count = run.normalizer.fold(word_count)
+    sorted_words = _rank_words(word_count, run.top)
+    total_count = sum(word_count.values())
+    output_format = run.options.get("format")
+    if output_format is not None:
+        write_structured(
+            run.result_path(f"CorpusResults.{STRUCTURED_FORMATS[output_format]}"),
+            output_format, sorted_words, total_count
+        )
+    return (run.result_path("CorpusResults.txt"),
+            format_corpus_results(_column_names(run.input_files), per_file, sorted_words,
+                                  run.elapsed(), total_count))
+
+
+def run_index(run):
+    """--index[=ruta]: cuenta y guarda el índice invertido palabra -> líneas."""
+    word_count, index_builder = read_words_indexed(run.input_files[0])
+    # Antes de normalizar: el índice guarda las palabras originales
+    index_path = run.options["index"]
+    if index_path is True:
+        index_path = run.result_path(f"{_get_tc_name(run.input_files[0])}.index")
+    index_builder.write(index_path, word_count)
+    return _report_word_count(run, word_count)
+
+
+def run_compact(run):
+    """--compact: vocabulario en arena de bytes (menos memoria, un proceso)."""
+    return _report_word_count(run, read_words_compact(run.input_files[0])[0])
+
+
+def run_incremental(run):
+    """--incremental[=checkpoint.json]: cuenta solo lo agregado desde la corrida anterior."""
+    checkpoint_path = run.options["incremental"]
+    if checkpoint_path is True:
+        checkpoint_path = run.result_path(f"{_get_tc_name(run.input_files[0])}.checkpoint.json")
+    return _report_word_count(run, read_words_incremental(run.input_files[0],
+                                                          checkpoint_path)[0])
+
+
+def run_bytes(run):
+    """--bytes: tokeniza bytes con mmap y decodifica solo palabras distintas."""
+    if run.corpus_mode:
+        return _run_corpus(run, read_words_bytes)
+    return _report_word_count(run, read_words_bytes(run.input_files[0])[0])
+
+
+def run_word_count(run):
+    """Conteo exacto por defecto: un archivo (en paralelo con --workers) o un corpus."""
+    if run.corpus_mode:
+        return _run_corpus(run, read_words_from_file)
+    if run.workers > 1:
+        return _report_word_count(run, read_words_parallel(run.input_files[0], run.workers)[0])
+    return _report_word_count(run, read_words_from_file(run.input_files[0])[0])
+
+
+# Modos de conteo en orden de prioridad: opción -> (manejador, opciones que
+# admite con un archivo, opciones que admite con un corpus o None si solo
+# acepta un archivo). None es el conteo exacto sin opción de modo. Cualquier
+# otra combinación se rechaza en lugar de ignorarse en silencio.
+MODES = {
+    "memory-budget": (run_memory_budget, ("top",), None),
+    "tfidf": (run_tfidf, ("bytes", "normalize", "stopwords"),
+              ("bytes", "normalize", "stopwords")),
+    "cardinality": (run_cardinality, ("workers",), ("workers",)),
+    "ngrams": (run_ngrams, ("max-ngrams", "top", "normalize", "stopwords"),
+               ("max-ngrams", "top", "normalize", "stopwords")),
+    "approx": (run_approx, ("workers", "top", "width", "depth", "heavy-hitters"),
+               ("workers", "top", "width", "depth", "heavy-hitters")),
+    "index": (run_index, EXACT_OPTIONS, None),
+    "compact": (run_compact, EXACT_OPTIONS, None),
+    "incremental": (run_incremental, EXACT_OPTIONS, None),
+    "bytes": (run_bytes, EXACT_OPTIONS, ("workers",) + EXACT_OPTIONS),
+    None: (run_word_count, ("workers",) + EXACT_OPTIONS, ("workers",) + EXACT_OPTIONS),
+}
+
+
+def select_mode(options, corpus_mode):
+    """
+    Elige el modo de conteo y valida que las demás opciones apliquen a él.
+
+    Termina con error si una opción es desconocida, si se combinan modos
+    incompatibles (p. ej. --compact con --workers o --bytes con
+    --incremental) o si un modo de un solo archivo recibe un corpus.
+
+    Returns:
+        Manejador del modo: recibe un RunSettings y devuelve (ruta, líneas)
+        del reporte, o None si ya lo escribió.
+    """
+    mode = next((name for name in MODES if name is not None and name in options), None)
+    handler, single_options, corpus_options = MODES[mode]
+    known = {name for name in MODES if name is not None}
+    for _, file_options, more_options in MODES.values():
+        known.update(file_options, more_options or ())
+    allowed = corpus_options if corpus_mode else single_options
+    if allowed is None:
+        print(f"Error: --{mode} solo admite un archivo.")
+        sys.exit(1)
+    for option in options:
+        if option not in known:
+            print(f"Error: opción desconocida --{option}.")
+            sys.exit(1)
+        if option != mode and option not in allowed:
+            target = f"con --{mode}" if mode is not None else "al conteo de palabras"
+            if corpus_mode and option in single_options:
+                target += " de un corpus"
+            elif not corpus_mode and corpus_options and option in corpus_options:
+                target += " de un solo archivo"
+            print(f"Error: --{option} no aplica {target}.")
+            sys.exit(1)
+    return handler
+
+
+def run_query(args):
+    """
+    Subcomando: python word_count.py query indice.index palabra [...]
+    (o un resultado .bin de --format=binary: solo conteos).
+    """
+    if len(args) < 3:
+        print("Uso: python word_count.py query archivo.index|archivo.bin palabra [palabra ...]")
+        sys.exit(1)
+    start_time = time.time()
+    if args[1].endswith(".bin"):
+        lines = query_results(args[1], args[2:])
+    else:
+        lines = query_index(args[1], args[2:])
+    lines.append(f"TIME ELAPSED\t{time.time() - start_time:.6f} seconds")
+    for line in lines:
         print(line)
 
 
+def _print_usage():
+    """Imprime la ayuda de invocación."""
+    print("Uso: python word_count.py [--workers=N] [--top=K] archivo_con_datos.txt "
+          "[archivo2.txt | carpeta | 'patrón*.txt' ...]")
+    print("     --normalize[=nfkc,casefold,punct] [--stopwords=archivo]: "
+          "normalizar palabras antes de reportar")
+    print("     --ngrams[=2,3] [--max-ngrams=N]: bigramas/trigramas con poda de raros")
+    print("     --index[=ruta]: guardar índice invertido; consultar con "
+          "'python word_count.py query ruta palabra ...'")
+    print("     --memory-budget=MB: volcar conteos a disco al superar el presupuesto")
+    print("     --bytes: tokenizar bytes con mmap y decodificar solo palabras distintas")
+    print("     --incremental[=checkpoint.json]: contar solo lo agregado desde la "
+          "corrida anterior")
+    print("     --cardinality[=12]: estimar solo el número de palabras distintas "
+          "(HyperLogLog)")
+    print("     --tfidf[=10]: términos con mayor TF-IDF por documento del corpus")
+    print("     --format=csv|jsonl|binary: además del reporte, conteos en formato "
+          "estructurado (binario consultable con query)")
+    print("     --compact: vocabulario en arena de bytes (menos memoria, un proceso)")
+    print("     --approx [--width=65536] [--depth=4] [--heavy-hitters=1000]: "
+          "conteo aproximado en memoria fija")
+
+
+def main():
+    """Punto de entrada principal del programa de conteo de palabras."""
+    options, args = parse_options(sys.argv[1:])
+    if args and args[0] == "query":
+        run_query(args)
+        return
+
+    input_files, expanded = expand_input_paths(args)
+    if not input_files:
+        _print_usage()
+        sys.exit(1)
+
+    corpus_mode = expanded or len(input_files) > 1
+    handler = select_mode(options, corpus_mode)
+    report = handler(RunSettings(options, input_files, corpus_mode))
+    if report is None:
+        return
+    output_file, output_lines = report
+    # Un solo write: un reporte de corpus puede tener millones de líneas
+    text = '\n'.join(output_lines) + '\n'
+
+    # Escribir en archivo
+    with open(output_file, 'w', encoding='utf-8') as file:
+        file.write(text)
+
+    # Imprimir en consola
+    sys.stdout.write(text)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,130 @@
+"""
+Benchmarks de Compute Sales - Actividad 5.2.
+
+Compara la suma de importes en float, en centavos enteros (--cents) y con
+Decimal sobre un registro de ventas sintético generado con el catálogo TC1:
+tiempo de la suma sola, tiempo de punta a punta (parseo en streaming más
+agregación) y exactitud del total contra la referencia Decimal.
+
+Invocación: python benchmark.py money [--rows=1000000] [--keep-file]
+"""
+
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from decimal import Decimal
+
+# Agregar el directorio source al path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'source'))
+
+import compute_sales  # noqa: E402  pylint: disable=wrong-import-position
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CATALOGUE_FILE = os.path.join(BASE_DIR, 'tests', 'TC1.ProductList.json')
+
+
+def generate_sales(path, rows, titles, seed=42):
+    """
+    Escribe un registro de ventas sintético (lista JSON, una venta por línea).
+
+    Args:
+        path: Ruta del archivo a generar.
+        rows: Número de ventas.
+        titles: Productos del catálogo a elegir al azar.
+        seed: Semilla para reproducibilidad.
+    """
+    rng = random.Random(seed)
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write('[\n')
+        for index in range(rows):
+            sale = {
+                "SALE_ID": index // 5 + 1,
+                "SALE_Date": f"{index % 28 + 1:02d}/12/23",
+                "Product": rng.choice(titles),
+                "Quantity": rng.randint(1, 500),
+            }
+            file.write((',\n' if index else '') + json.dumps(sale))
+        file.write('\n]\n')
+
+
+def _sum_items(catalogue, items):
+    """Suma precio * cantidad sobre ítems ya parseados (solo aritmética)."""
+    total = 0
+    for product, quantity in items:
+        total += catalogue[product] * quantity
+    return total
+
+
+def _time_mode(catalogue, items, sales_path):
+    """
+    Mide un modo: la suma sola sobre ítems parseados y la corrida completa.
+
+    Returns:
+        Tupla (segundos de la suma, segundos de punta a punta, total).
+    """
+    start = time.perf_counter()
+    _sum_items(catalogue, items)
+    sum_time = time.perf_counter() - start
+    start = time.perf_counter()
+    total, _, _ = compute_sales.aggregate_by_product(
+        catalogue, compute_sales.stream_json_file(sales_path))
+    return sum_time, time.perf_counter() - start, total
+
+
+def bench_money(sales_path, float_catalogue):
+    """
+    Mide float, centavos y Decimal sobre el mismo registro.
+
+    Returns:
+        Lista de líneas del reporte.
+    """
+    catalogues = {
+        "float": float_catalogue,
+        "cents": compute_sales.catalogue_to_cents(float_catalogue),
+        "decimal": {title: Decimal(repr(price)) for title, price in float_catalogue.items()},
+    }
+    items = list(compute_sales.iter_sales_items(compute_sales.stream_json_file(sales_path)))
+    results = {mode: _time_mode(catalogue, items, sales_path)
+               for mode, catalogue in catalogues.items()}
+
+    exact = results["decimal"][2]
+    lines = [f"ROWS\t{len(items)}",
+             "MODE\tSUM s\tEND-TO-END s\tTOTAL\tEXACT\tDRIFT (centavos)"]
+    for mode, (sum_time, full_time, total) in results.items():
+        if mode == "cents":
+            formatted, value = compute_sales.format_cents(total), Decimal(total) / 100
+        else:
+            formatted, value = f"{total:.2f}", Decimal(total)
+        lines.append(
+            f"{mode}\t{sum_time:.3f}\t{full_time:.3f}\t{formatted}\t"
+            f"{formatted == f'{exact:.2f}'}\t{(value - exact) * 100:.6f}"
+        )
+    return lines
+
+
+def main():
+    """Punto de entrada: python benchmark.py money [--rows=N] [--keep-file]."""
+    options, positional = compute_sales.parse_options(sys.argv[1:])
+    if positional != ["money"]:
+        print("Uso: python benchmark.py money [--rows=1000000] [--keep-file]")
+        sys.exit(1)
+    rows = int(options.get("rows", 1000000))
+    catalogue = compute_sales.build_catalogue_from_product_list(
+        compute_sales.load_json_file(CATALOGUE_FILE))
+    sales_path = os.path.join(tempfile.gettempdir(), f"compute_sales_{rows}.json")
+    if not os.path.exists(sales_path):
+        print(f"Generando {rows} ventas sintéticas en {sales_path}...")
+        generate_sales(sales_path, rows, sorted(catalogue))
+    try:
+        for line in bench_money(sales_path, catalogue):
+            print(line)
+    finally:
+        if "keep-file" not in options:
+            os.remove(sales_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+Caché de catálogo compilado para Compute Sales - Actividad 5.2.
+
+Guarda solo título -> precio en un binario compacto, para no volver a
+parsear el JSON completo del catálogo (descripción, imagen, medidas, etc.)
+en cada corrida. El caché queda ligado al archivo fuente por tamaño, mtime
+y SHA-256: si cambia el mtime pero no el contenido, se reutiliza.
+
+Formato (little-endian):
+    encabezado   CACHE_HEADER: magia, tamaño y mtime (ns) de la fuente,
+                 SHA-256 de la fuente, número de productos
+    precios      n flotantes de 64 bits
+    longitudes   n enteros de 32 bits: caracteres de cada título
+    títulos      títulos concatenados en UTF-8
+"""
+
+import hashlib
+import os
+import struct
+import sys
+from array import array
+
+CACHE_MAGIC = b"CSC1"
+CACHE_HEADER = struct.Struct("<4sQq32sI")
+
+# Bytes por lectura al calcular el SHA-256 de la fuente
+DIGEST_BLOCK_SIZE = 1 << 20
+
+
+def source_digest(file_path):
+    """SHA-256 del archivo fuente, leído por bloques."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for block in iter(lambda: file.read(DIGEST_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.digest()
+
+
+def _little_endian(values):
+    """Bytes little-endian de un array tipado."""
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_little_endian(typecode, data):
+    """Array tipado a partir de bytes little-endian."""
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def _write_header(file, stat, digest, size):
+    """Escribe el encabezado con la identidad de la fuente."""
+    file.write(CACHE_HEADER.pack(CACHE_MAGIC, stat.st_size, stat.st_mtime_ns, digest, size))
+
+
+def write_catalogue_cache(cache_path, catalogue, source_path):
+    """
+    Compila el catálogo a cache_path, ligado a source_path.
+
+    Args:
+        cache_path: Ruta del binario a escribir.
+        catalogue: Dict título -> precio ya construido.
+        source_path: JSON del que se construyó el catálogo.
+    """
+    titles = list(catalogue)
+    prices = array('d', (catalogue[title] for title in titles))
+    lengths = array('I', (len(title) for title in titles))
+    stat = os.stat(source_path)
+    digest = source_digest(source_path)
+    os.makedirs(os.path.dirname(os.path.abspath(cache_path)), exist_ok=True)
+    with open(cache_path, 'wb') as file:
+        _write_header(file, stat, digest, len(titles))
+        file.write(_little_endian(prices))
+        file.write(_little_endian(lengths))
+        file.write("".join(titles).encode('utf-8'))
+
+
+def _decode_body(data, count):
+    """
+    Reconstruye el catálogo a partir del cuerpo del caché.
+
+    Returns:
+        Dict título -> precio, o None si el cuerpo está truncado o dañado.
+    """
+    prices_end = CACHE_HEADER.size + 8 * count
+    lengths_end = prices_end + 4 * count
+    try:
+        prices = _from_little_endian('d', data[CACHE_HEADER.size:prices_end])
+        lengths = _from_little_endian('I', data[prices_end:lengths_end])
+        blob = data[lengths_end:].decode('utf-8')
+    except (ValueError, UnicodeDecodeError):
+        return None
+    if len(prices) != count or len(lengths) != count or sum(lengths) != len(blob):
+        return None
+
+    catalogue = {}
+    start = 0
+    for price, length in zip(prices, lengths):
+        catalogue[blob[start:start + length]] = price
+        start += length
+    return catalogue
+
+
+def _refresh_header(cache_path, stat, digest, count):
+    """Reescribe el encabezado con el mtime actual; False si no se puede escribir."""
+    try:
+        with open(cache_path, 'r+b') as file:
+            _write_header(file, stat, digest, count)
+    except OSError:
+        return False
+    return True
+
+
+def load_catalogue_cache(cache_path, source_path):
+    """
+    Carga el catálogo compilado si sigue correspondiendo a source_path.
+
+    Si tamaño y mtime coinciden no se lee la fuente. Si solo cambió el mtime
+    se compara el SHA-256 y, si coincide, se actualiza el encabezado; el
+    cuerpo se valida antes de escribir nada, y si el encabezado no se puede
+    escribir (caché de solo lectura) se trata como caché ausente.
+
+    Returns:
+        Dict título -> precio, o None si no hay caché válido (ausente,
+        dañado o de otra versión de la fuente).
+    """
+    try:
+        with open(cache_path, 'rb') as file:
+            data = file.read()
+        stat = os.stat(source_path)
+    except OSError:
+        return None
+    if len(data) < CACHE_HEADER.size:
+        return None
+    magic, size, mtime_ns, digest, count = CACHE_HEADER.unpack_from(data)
+    if magic != CACHE_MAGIC or size != stat.st_size:
+        return None
+    catalogue = _decode_body(data, count)
+    if catalogue is not None and mtime_ns != stat.st_mtime_ns:
+        if (source_digest(source_path) != digest
+                or not _refresh_header(cache_path, stat, digest, count)):
+            return None
+    return catalogue
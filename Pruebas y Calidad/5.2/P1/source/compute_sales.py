@@ -8,12 +8,50 @@ Formato catálogo: lista de objetos con "title" y "price".
 Formato ventas: lista de objetos con "Product" y "Quantity".
 
 Invocación: python computeSales.py priceCatalogue.json salesRecord.json
+           python computeSales.py [--workers=N] priceCatalogue.json ventas1.json ventas2.json ...
+           python computeSales.py --aggregate priceCatalogue.json salesRecord.json
+           python computeSales.py --group-by=date,sale,date-product \
+               priceCatalogue.json salesRecord.json
+           python computeSales.py compile-catalogue priceCatalogue.json  (caché compilado)
+           python computeSales.py --cents priceCatalogue.json salesRecord.json  (centavos exactos)
+           python computeSales.py --match=fuzzy priceCatalogue.json salesRecord.json
 """
 
 import json
 import os
 import sys
 import time
+from collections.abc import Iterator
+from datetime import datetime
+from decimal import ROUND_HALF_UP, Decimal
+from multiprocessing import Pool
+
+from catalogue_cache import load_catalogue_cache, write_catalogue_cache
+from json_stream import stream_json_file
+from product_matching import TolerantCatalogue
+
+# Agrupaciones de --group-by: nombre -> columnas del registro de ventas
+GROUP_BY_COLUMNS = {
+    "date": ("SALE_Date",),
+    "sale": ("SALE_ID",),
+    "date-product": ("SALE_Date", "Product"),
+}
+
+# Modos de --match para productos que no coinciden exactamente con el catálogo
+MATCH_MODES = ("exact", "normalized", "fuzzy")
+
+# Formato de SALE_Date en los archivos de apoyo (día/mes/año de 2 dígitos)
+SALE_DATE_FORMAT = "%d/%m/%y"
+INVALID_DATE = "(fecha inválida)"
+
+# Grupo de SALE_ID que no es número ni texto (listas, objetos, booleanos)
+INVALID_SALE_ID = "(SALE_ID inválido)"
+
+# Carpeta de reportes (mismo nivel que source)
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "results")
+
+# Catálogo de cada proceso del modo lote (ver _init_batch_worker)
+_BATCH_CATALOGUE = {}
 
 
 def load_json_file(file_path):
@@ -80,22 +118,53 @@ def build_catalogue_from_product_list(raw_data):
     return catalogue
 
 
-def iter_sales_items(raw_sales):
+def catalogue_to_cents(catalogue):
+    """
+    Convierte los precios del catálogo a centavos enteros, una vez por producto.
+
+    Se parte del texto decimal más corto del float (repr), así 21.32 da
+    exactamente 2132; con más de dos decimales se redondea al centavo
+    (mitad hacia arriba).
+
+    Returns:
+        Dict título -> precio en centavos (int).
+    """
+    return {
+        title: int(Decimal(repr(price)).scaleb(2).to_integral_value(rounding=ROUND_HALF_UP))
+        for title, price in catalogue.items()
+    }
+
+
+def format_cents(cents):
+    """Centavos enteros como texto con dos decimales (mismo formato que :.2f)."""
+    sign = "-" if cents < 0 else ""
+    return f"{sign}{abs(cents) // 100}.{abs(cents) % 100:02d}"
+
+
+def _money(amount, cents):
+    """Formatea un importe: centavos enteros si cents, si no float con :.2f."""
+    return format_cents(amount) if cents else f"{amount:.2f}"
+
+
+def iter_sales_items(raw_sales, fields=()):
     """
     Itera sobre cada ítem de venta del registro A5.2.
 
     Formato: lista de objetos con "Product" y "Quantity".
 
     Args:
-        raw_sales: Lista cargada del JSON de ventas.
+        raw_sales: Lista cargada del JSON de ventas, o iterador de
+            stream_json_file (se consume una fila a la vez).
+        fields: Columnas adicionales a conservar (p. ej. "SALE_ID");
+            None si faltan en la fila.
 
     Yields:
-        Tuplas (producto, cantidad).
+        Tuplas (producto, cantidad, *valores de fields).
     """
     if raw_sales is None:
         return
 
-    if not isinstance(raw_sales, list):
+    if not isinstance(raw_sales, (list, Iterator)):
         print("Error ventas: se esperaba una lista de ventas.")
         return
 
@@ -115,21 +184,28 @@ def iter_sales_items(raw_sales):
         except (TypeError, ValueError):
             print(f"Error ventas: 'Quantity' inválida en fila [{idx}].")
             continue
-        yield (str(product), qty)
+        if fields:
+            yield (str(product), qty) + tuple(row.get(field) for field in fields)
+        else:
+            yield (str(product), qty)
 
 
 def compute_total_cost(catalogue, raw_sales):
     """
     Calcula el costo total y el detalle por ítem.
 
+    El parseo es en streaming, pero el detalle conserva una tupla por fila
+    (memoria proporcional a las filas); aggregate_by_product acumula por
+    producto en su lugar.
+
     Args:
         catalogue: Dict producto -> precio.
-        raw_sales: Lista de ventas (JSON cargado).
+        raw_sales: Lista de ventas (JSON cargado) o iterador en streaming.
 
     Returns:
         Tupla (costo_total, lista de (producto, cantidad, precio, subtotal)).
     """
-    total = 0.0
+    total = 0
     details = []
 
     for product, quantity in iter_sales_items(raw_sales):
@@ -145,7 +221,372 @@ def compute_total_cost(catalogue, raw_sales):
     return (total, details)
 
 
-def format_results(total, details, elapsed_seconds):
+def catalogue_title(catalogue, product):
+    """
+    Título del catálogo al que corresponde product, o None si no está.
+
+    Con --match el catálogo (TolerantCatalogue) resuelve variantes del nombre
+    al título canónico; un dict simple solo acepta el título exacto.
+    """
+    resolve = getattr(catalogue, "resolve", None)
+    if resolve is not None:
+        return resolve(product)
+    return product if product in catalogue else None
+
+
+def aggregate_by_product(catalogue, raw_sales):
+    """
+    Acumula cantidad, ingreso y filas por producto en lugar del detalle por fila.
+
+    La memoria es proporcional a los productos distintos, no a las filas.
+    Las variantes de un nombre resueltas con --match se acumulan en el
+    título del catálogo.
+
+    Args:
+        catalogue: Dict producto -> precio.
+        raw_sales: Lista de ventas (JSON cargado) o iterador en streaming.
+
+    Returns:
+        Tupla (costo_total, dict producto -> [cantidad, ingreso, filas],
+        dict producto_desconocido -> [cantidad, filas]).
+    """
+    total = 0
+    products = {}
+    unknown = {}
+    # Nombre en ventas -> (acumulador de su título, precio)
+    known = {}
+
+    for product, quantity in iter_sales_items(raw_sales):
+        entry = known.get(product)
+        if entry is None:
+            title = catalogue_title(catalogue, product)
+            if title is None:
+                missing = unknown.get(product)
+                if missing is None:
+                    print(f"Advertencia: producto '{product}' no está en el catálogo; se omite.")
+                    unknown[product] = [quantity, 1]
+                else:
+                    missing[0] += quantity
+                    missing[1] += 1
+                continue
+            accumulator = products.get(title)
+            if accumulator is None:
+                accumulator = products[title] = [0, 0, 0]
+            entry = known[product] = (accumulator, catalogue[title])
+        accumulator, price = entry
+        subtotal = price * quantity
+        total += subtotal
+        accumulator[0] += quantity
+        accumulator[1] += subtotal
+        accumulator[2] += 1
+
+    return (total, products, unknown)
+
+
+def format_product_results(total, products, unknown, elapsed_seconds, cents=False):
+    """
+    Genera líneas del resumen por producto, ordenado por ingreso descendente.
+
+    Args:
+        total: Costo total.
+        products: Dict producto -> [cantidad, ingreso, filas].
+        unknown: Dict producto_desconocido -> [cantidad, filas].
+        elapsed_seconds: Tiempo de ejecución en segundos.
+        cents: Importes en centavos enteros (--cents).
+
+    Returns:
+        Lista de cadenas.
+    """
+    lines = [
+        "=" * 60,
+        "RESULTADOS DE VENTAS (POR PRODUCTO)",
+        "=" * 60,
+        "",
+        "Resumen por producto (ingreso descendente):",
+        "-" * 60
+    ]
+
+    ranked = sorted(products.items(), key=lambda item: (-item[1][1], item[0]))
+    for product, (quantity, revenue, rows) in ranked:
+        lines.append(f"  {product}: {quantity} unidades en {rows} filas = {_money(revenue, cents)}")
+    for product, (quantity, rows) in sorted(unknown.items()):
+        lines.append(f"  {product}: {quantity} unidades en {rows} filas (no en catálogo)")
+
+    lines.extend([
+        "-" * 60,
+        f"PRODUCTOS: {len(products)}",
+        f"TOTAL: {_money(total, cents)}",
+        "",
+        f"Tiempo de ejecución: {elapsed_seconds:.6f} segundos",
+        "=" * 60
+    ])
+    return lines
+
+
+def parse_sale_date(text, cache):
+    """
+    Convierte SALE_Date ("dd/mm/aa") a ISO "aaaa-mm-dd", una vez por cadena.
+
+    Args:
+        text: Valor de SALE_Date de la fila.
+        cache: Dict cadena -> fecha ISO, compartido durante la pasada.
+
+    Returns:
+        Fecha ISO (ordenable como texto) o INVALID_DATE.
+    """
+    if not isinstance(text, str):
+        return INVALID_DATE
+    iso = cache.get(text)
+    if iso is None:
+        try:
+            iso = datetime.strptime(text, SALE_DATE_FORMAT).date().isoformat()
+        except ValueError:
+            print(f"Advertencia: fecha inválida '{text}'; se agrupa como '{INVALID_DATE}'.")
+            iso = INVALID_DATE
+        cache[text] = iso
+    return iso
+
+
+def sale_id_key(value):
+    """
+    Llave de grupo para SALE_ID: números, texto o None tal cual.
+
+    Cualquier otro valor (lista, objeto, booleano) no es una llave válida
+    y se agrupa como INVALID_SALE_ID.
+    """
+    if value is None or (isinstance(value, (int, float, str)) and not isinstance(value, bool)):
+        return value
+    print(f"Advertencia: SALE_ID inválido {json.dumps(value)}; "
+          f"se agrupa como '{INVALID_SALE_ID}'.")
+    return INVALID_SALE_ID
+
+
+def _add_to_groups(tables, row, title, subtotal, date_cache):
+    """
+    Suma una fila a los acumuladores [cantidad, ingreso, filas] de cada agrupación.
+
+    Args:
+        tables: Dict agrupación -> {llave: acumulador}.
+        row: Tupla (producto, cantidad, SALE_ID, SALE_Date) de iter_sales_items.
+        title: Título del catálogo del producto.
+        subtotal: Ingreso de la fila.
+        date_cache: Caché de parse_sale_date.
+    """
+    _, quantity, sale_id, sale_date = row
+    date = None
+    if "date" in tables or "date-product" in tables:
+        date = parse_sale_date(sale_date, date_cache)
+    for grouping, table in tables.items():
+        if grouping == "date":
+            key = (date,)
+        elif grouping == "sale":
+            key = (sale_id_key(sale_id),)
+        else:
+            key = (date, title)
+        accumulator = table.get(key)
+        if accumulator is None:
+            table[key] = [quantity, subtotal, 1]
+        else:
+            accumulator[0] += quantity
+            accumulator[1] += subtotal
+            accumulator[2] += 1
+
+
+def group_sales(catalogue, raw_sales, groupings):
+    """
+    Agrega ventas por una o varias agrupaciones en una sola pasada.
+
+    date-product usa el título del catálogo, así las variantes de un nombre
+    resueltas con --match caen en el mismo grupo.
+
+    Args:
+        catalogue: Dict producto -> precio.
+        raw_sales: Lista de ventas (JSON cargado) o iterador en streaming.
+        groupings: Nombres de GROUP_BY_COLUMNS.
+
+    Returns:
+        Tupla (costo_total, dict agrupación -> {llave: [cantidad, ingreso,
+        filas]}, filas omitidas por producto desconocido).
+    """
+    total = 0
+    # Producto desconocido -> filas omitidas (se avisa una vez por producto)
+    omitted = {}
+    date_cache = {}
+    tables = {grouping: {} for grouping in groupings}
+    # Nombre en ventas -> (título del catálogo, precio)
+    known = {}
+
+    for row in iter_sales_items(raw_sales, ("SALE_ID", "SALE_Date")):
+        product = row[0]
+        entry = known.get(product)
+        if entry is None:
+            title = catalogue_title(catalogue, product)
+            if title is None:
+                if product not in omitted:
+                    print(f"Advertencia: producto '{product}' no está en el catálogo; se omite.")
+                omitted[product] = omitted.get(product, 0) + 1
+                continue
+            entry = known[product] = (title, catalogue[title])
+        subtotal = entry[1] * row[1]
+        total += subtotal
+        _add_to_groups(tables, row, entry[0], subtotal, date_cache)
+
+    return (total, tables, sum(omitted.values()))
+
+
+def _group_sort_key(key):
+    """Ordena llaves de grupo: números antes que texto y None al final."""
+    return tuple(
+        (0, value, "") if isinstance(value, (int, float)) and not isinstance(value, bool)
+        else (2, 0, "") if value is None
+        else (1, 0, str(value))
+        for value in key
+    )
+
+
+def format_group_results(total, tables, omitted, elapsed_seconds, cents=False):
+    """
+    Genera tablas compactas separadas por tabuladores, una por agrupación.
+
+    Args:
+        total: Costo total.
+        tables: Dict agrupación -> {llave: [cantidad, ingreso, filas]}.
+        omitted: Filas omitidas por producto desconocido.
+        elapsed_seconds: Tiempo de ejecución en segundos.
+        cents: Importes en centavos enteros (--cents).
+
+    Returns:
+        Lista de cadenas.
+    """
+    lines = []
+    for grouping, table in tables.items():
+        columns = "\t".join(GROUP_BY_COLUMNS[grouping])
+        lines.append(f"GROUP BY\t{grouping}")
+        lines.append(f"{columns}\tQuantity\tRows\tRevenue")
+        for key in sorted(table, key=_group_sort_key):
+            quantity, revenue, rows = table[key]
+            values = "\t".join("" if value is None else str(value) for value in key)
+            lines.append(f"{values}\t{quantity}\t{rows}\t{_money(revenue, cents)}")
+        lines.append("")
+    lines.extend([
+        f"OMITTED ROWS\t{omitted}",
+        f"TOTAL\t{_money(total, cents)}",
+        f"Tiempo de ejecución\t{elapsed_seconds:.6f} segundos",
+    ])
+    return lines
+
+
+def compute_file_summary(catalogue, sales_path):
+    """
+    Total de un archivo de ventas en streaming, sin guardar el detalle.
+
+    Args:
+        catalogue: Dict producto -> precio.
+        sales_path: Ruta al JSON de ventas.
+
+    Returns:
+        Tupla (ruta, total, filas contadas, filas omitidas, productos
+        desconocidos ordenados, mensaje de error o None).
+    """
+    total = 0
+    rows = 0
+    omitted = 0
+    unknown = set()
+    raw_sales = stream_json_file(sales_path)
+    if raw_sales is None:
+        return (sales_path, 0.0, 0, 0, [], "no se pudo abrir")
+    try:
+        for product, quantity in iter_sales_items(raw_sales):
+            price = catalogue.get(product)
+            if price is None:
+                omitted += 1
+                unknown.add(product)
+                continue
+            total += price * quantity
+            rows += 1
+    except ValueError as err:
+        return (sales_path, 0.0, 0, 0, [], f"JSON inválido: {err}")
+    except OSError as err:
+        return (sales_path, 0.0, 0, 0, [], f"error de lectura: {err.strerror}")
+    return (sales_path, total, rows, omitted, sorted(unknown), None)
+
+
+def _init_batch_worker(catalogue):
+    """
+    Inicializa un proceso del lote con el catálogo ya construido.
+
+    Con el método fork (Linux/macOS) los argumentos no se serializan: cada
+    proceso hereda el diccionario del padre y lo comparte por copy-on-write.
+    """
+    global _BATCH_CATALOGUE  # pylint: disable=global-statement
+    _BATCH_CATALOGUE = catalogue
+
+
+def _batch_file_summary(sales_path):
+    """compute_file_summary con el catálogo del proceso (para Pool.imap)."""
+    return compute_file_summary(_BATCH_CATALOGUE, sales_path)
+
+
+def compute_batch(catalogue, sales_paths, workers):
+    """
+    Procesa varios archivos de ventas con un solo catálogo.
+
+    Args:
+        catalogue: Dict producto -> precio, construido una sola vez.
+        sales_paths: Rutas de los archivos de ventas.
+        workers: Número de procesos (1 = secuencial).
+
+    Returns:
+        Lista de resúmenes de compute_file_summary, en el orden de sales_paths.
+    """
+    if workers <= 1 or len(sales_paths) <= 1:
+        return [compute_file_summary(catalogue, path) for path in sales_paths]
+    with Pool(processes=min(workers, len(sales_paths)), initializer=_init_batch_worker,
+              initargs=(catalogue,)) as pool:
+        return pool.map(_batch_file_summary, sales_paths, chunksize=1)
+
+
+def format_batch_results(summaries, elapsed_seconds, cents=False):
+    """
+    Genera líneas del modo lote: total por archivo y total general.
+
+    Args:
+        summaries: Lista de resúmenes de compute_file_summary.
+        elapsed_seconds: Tiempo de ejecución en segundos.
+        cents: Importes en centavos enteros (--cents).
+
+    Returns:
+        Lista de cadenas.
+    """
+    lines = [
+        "=" * 60,
+        "RESULTADOS DE VENTAS (LOTE)",
+        "=" * 60,
+        "",
+        "Total por archivo:",
+        "-" * 60
+    ]
+
+    grand_total = 0
+    for path, total, rows, omitted, _, error in summaries:
+        name = os.path.basename(path)
+        if error is not None:
+            lines.append(f"  {name}: ERROR ({error})")
+            continue
+        grand_total += total
+        lines.append(f"  {name}: {rows} filas, {omitted} omitidas, total {_money(total, cents)}")
+
+    lines.extend([
+        "-" * 60,
+        f"TOTAL GENERAL: {_money(grand_total, cents)}",
+        "",
+        f"Tiempo de ejecución: {elapsed_seconds:.6f} segundos",
+        "=" * 60
+    ])
+    return lines
+
+
+def format_results(total, details, elapsed_seconds, cents=False):
     """
     Genera líneas de resultado legibles (pantalla y archivo).
 
@@ -153,6 +594,7 @@ def format_results(total, details, elapsed_seconds):
         total: Costo total.
         details: Lista de (producto, cantidad, precio, subtotal).
         elapsed_seconds: Tiempo de ejecución en segundos.
+        cents: Importes en centavos enteros (--cents).
 
     Returns:
         Lista de cadenas.
@@ -170,11 +612,12 @@ def format_results(total, details, elapsed_seconds):
         if price is None:
             lines.append(f"  {product}: cantidad {quantity} (no en catálogo)")
         else:
-            lines.append(f"  {product}: {quantity} x {price:.2f} = {subtotal:.2f}")
+            lines.append(f"  {product}: {quantity} x {_money(price, cents)} = "
+                         f"{_money(subtotal, cents)}")
 
     lines.extend([
         "-" * 60,
-        f"TOTAL: {total:.2f}",
+        f"TOTAL: {_money(total, cents)}",
         "",
         f"Tiempo de ejecución: {elapsed_seconds:.6f} segundos",
         "=" * 60
@@ -182,43 +625,287 @@ def format_results(total, details, elapsed_seconds):
     return lines
 
 
-def main():
-    """Punto de entrada. Uso: python computeSales.py priceCatalogue.json salesRecord.json"""
-    if len(sys.argv) < 3:
-        print("Uso: python computeSales.py priceCatalogue.json salesRecord.json")
+def parse_options(args):
+    """
+    Separa opciones (--nombre o --nombre=valor) de los archivos de entrada.
+
+    Returns:
+        Tupla (diccionario opción -> valor, lista de archivos).
+    """
+    options = {}
+    files = []
+    for arg in args:
+        if arg.startswith("--"):
+            name, _, value = arg[2:].partition("=")
+            options[name] = value or True
+        else:
+            files.append(arg)
+    return options, files
+
+
+def _int_option(options, name, default):
+    """Lee una opción entera positiva; termina con error si es inválida."""
+    value = options.get(name, default)
+    if value is True or not str(value).isdigit() or int(value) < 1:
+        print(f"Error: --{name} requiere un entero positivo.")
         sys.exit(1)
+    return int(value)
 
-    catalogue_path = sys.argv[1]
-    sales_path = sys.argv[2]
 
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    output_path = os.path.join(script_dir, "..", "results", "SalesResults.txt")
+def _write_lines(output_path, lines):
+    """Escribe las líneas en output_path y las imprime en consola."""
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as out:
+        for line in lines:
+            out.write(line + "\n")
 
-    start_time = time.time()
+    for line in lines:
+        print(line)
 
-    raw_catalogue = load_json_file(catalogue_path)
-    raw_sales = load_json_file(sales_path)
 
-    if raw_catalogue is None or raw_sales is None:
+def _catalogue_cache_path(options, catalogue_path):
+    """Ruta del caché compilado (--catalogue-cache[=ruta]) o None si no se pidió."""
+    cache_path = options.get("catalogue-cache")
+    if cache_path is True:
+        name = os.path.splitext(os.path.basename(catalogue_path))[0]
+        cache_path = os.path.join(RESULTS_DIR, f"{name}.catalogue.bin")
+    return cache_path
+
+
+def load_catalogue(catalogue_path, cache_path=None, rebuild=False):
+    """
+    Construye el catálogo, usando el caché compilado si se indicó uno.
+
+    Args:
+        catalogue_path: JSON del catálogo.
+        cache_path: Ruta del caché compilado, o None para no usarlo.
+        rebuild: Ignorar el caché existente y volver a compilarlo.
+
+    Returns:
+        Dict título -> precio. Termina con error si el catálogo es inválido.
+    """
+    if cache_path is not None and not rebuild:
+        catalogue = load_catalogue_cache(cache_path, catalogue_path)
+        if catalogue:
+            return catalogue
+
+    raw_catalogue = load_json_file(catalogue_path)
+    if raw_catalogue is None:
         sys.exit(1)
 
     catalogue = build_catalogue_from_product_list(raw_catalogue)
     if not catalogue:
         print("Error: El catálogo está vacío o es inválido.")
         sys.exit(1)
+    if cache_path is not None:
+        try:
+            write_catalogue_cache(cache_path, catalogue, catalogue_path)
+        except OSError:
+            print(f"Advertencia: no se pudo escribir el caché '{cache_path}'; "
+                  "se continúa sin caché.")
+    return catalogue
 
-    total, details = compute_total_cost(catalogue, raw_sales)
-    elapsed = time.time() - start_time
 
-    lines = format_results(total, details, elapsed)
+def build_run_catalogue(options, catalogue_path):
+    """
+    Catálogo listo para los modos: caché, centavos (--cents) y --match.
 
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    with open(output_path, 'w', encoding='utf-8') as out:
-        for line in lines:
-            out.write(line + "\n")
+    Termina con error si --match no es válido o el catálogo es inválido.
+    """
+    match_mode = options.get("match", "normalized")
+    if match_mode not in MATCH_MODES:
+        print(f"Error: --match acepta {', '.join(MATCH_MODES)}.")
+        sys.exit(1)
+    catalogue = load_catalogue(catalogue_path, _catalogue_cache_path(options, catalogue_path))
+    if "cents" in options:
+        # Punto fijo: precios a centavos una vez; las sumas quedan enteras y exactas
+        catalogue = catalogue_to_cents(catalogue)
+    if match_mode != "exact":
+        # Índice normalizado (y trigramas con fuzzy) junto al diccionario exacto
+        catalogue = TolerantCatalogue(catalogue, fuzzy=match_mode == "fuzzy")
+    return catalogue
 
-    for line in lines:
-        print(line)
+
+class SalesRun:
+    """Catálogo y opciones ya validadas de una corrida, compartidos por los modos de main."""
+
+    __slots__ = ("options", "sales_paths", "cents", "start_time", "catalogue")
+
+    def __init__(self, options, catalogue_path, sales_paths):
+        """
+        Args:
+            options: Diccionario opción -> valor de parse_options.
+            catalogue_path: JSON del catálogo.
+            sales_paths: Archivos de ventas.
+        """
+        self.options = options
+        self.sales_paths = sales_paths
+        self.cents = "cents" in options
+        # Iniciar cronometraje (incluye construir el catálogo)
+        self.start_time = time.time()
+        self.catalogue = build_run_catalogue(options, catalogue_path)
+
+    def stream_sales(self):
+        """Ventas del único archivo en streaming; termina con error si no se abre."""
+        raw_sales = stream_json_file(self.sales_paths[0])
+        if raw_sales is None:
+            sys.exit(1)
+        return raw_sales
+
+    def result_path(self, file_name):
+        """Ruta de file_name dentro de la carpeta results."""
+        return os.path.join(RESULTS_DIR, file_name)
+
+    def elapsed(self):
+        """Segundos transcurridos desde el inicio del cronometraje."""
+        return time.time() - self.start_time
+
+
+def run_detail(run):
+    """Modo por defecto: detalle por fila de un archivo de ventas."""
+    total, details = compute_total_cost(run.catalogue, run.stream_sales())
+    return (run.result_path("SalesResults.txt"),
+            format_results(total, details, run.elapsed(), run.cents))
+
+
+def run_aggregate(run):
+    """--aggregate: un acumulador por producto (memoria proporcional al catálogo)."""
+    total, products, unknown = aggregate_by_product(run.catalogue, run.stream_sales())
+    return (run.result_path("ProductSalesResults.txt"),
+            format_product_results(total, products, unknown, run.elapsed(), run.cents))
+
+
+def _groupings(options):
+    """Agrupaciones de --group-by sin duplicados; termina con error si son inválidas."""
+    value = options["group-by"]
+    groupings = [] if value is True else value.split(",")
+    if not groupings or not set(groupings) <= set(GROUP_BY_COLUMNS):
+        print(f"Error: --group-by acepta {', '.join(GROUP_BY_COLUMNS)} "
+              "separados por comas.")
+        sys.exit(1)
+    return list(dict.fromkeys(groupings))
+
+
+def run_group_by(run):
+    """--group-by: todas las agrupaciones en la misma pasada en streaming."""
+    raw_sales = run.stream_sales()
+    total, tables, omitted = group_sales(run.catalogue, raw_sales, _groupings(run.options))
+    return (run.result_path("GroupSalesResults.txt"),
+            format_group_results(total, tables, omitted, run.elapsed(), run.cents))
+
+
+def run_batch(run):
+    """Lote: el catálogo se construye una vez y los archivos se reparten entre procesos."""
+    workers = _int_option(run.options, "workers",
+                          min(len(run.sales_paths), os.cpu_count() or 1))
+    summaries = compute_batch(run.catalogue, run.sales_paths, workers)
+    for path, _, _, _, unknown, _ in summaries:
+        for product in unknown:
+            print(f"Advertencia: producto '{product}' no está en el catálogo "
+                  f"({os.path.basename(path)}); se omite.")
+    return (run.result_path("BatchSalesResults.txt"),
+            format_batch_results(summaries, run.elapsed(), run.cents))
+
+
+# Opciones que aplican a todos los modos
+SHARED_OPTIONS = ("catalogue-cache", "cents", "match")
+
+# Modos en orden de prioridad: opción -> ((manejador, opciones) con un
+# archivo de ventas, (manejador, opciones) del lote o None si solo acepta un
+# archivo). None es el detalle por fila sin opción de modo. Cualquier otra
+# combinación se rechaza en lugar de ignorarse en silencio.
+MODES = {
+    "group-by": ((run_group_by, SHARED_OPTIONS), None),
+    "aggregate": ((run_aggregate, SHARED_OPTIONS), None),
+    None: ((run_detail, SHARED_OPTIONS), (run_batch, ("workers",) + SHARED_OPTIONS)),
+}
+
+
+def select_mode(options, batch_mode):
+    """
+    Elige el modo y valida que las demás opciones apliquen a él.
+
+    Termina con error si una opción es desconocida, si se combinan modos
+    (--aggregate con --group-by), si un modo de un solo archivo recibe un
+    lote o si --workers se usa con un solo archivo de ventas.
+
+    Returns:
+        Manejador del modo: recibe un SalesRun y devuelve (ruta, líneas).
+    """
+    known = {name for name in MODES if name is not None}
+    for single, batch in MODES.values():
+        known.update(single[1], batch[1] if batch else ())
+    for option in options:
+        if option not in known:
+            print(f"Error: opción desconocida --{option}.")
+            sys.exit(1)
+    modes = [name for name in MODES if name is not None and name in options]
+    if len(modes) > 1:
+        print(f"Error: --{modes[0]} no se puede combinar con --{modes[1]}.")
+        sys.exit(1)
+    mode = modes[0] if modes else None
+    single, batch = MODES[mode]
+    if batch_mode and batch is None:
+        print(f"Error: --{mode} solo admite un archivo de ventas.")
+        sys.exit(1)
+    handler, allowed = batch if batch_mode else single
+    for option in options:
+        if option != mode and option not in allowed:
+            target = f"con --{mode}" if mode is not None else "con un solo archivo de ventas"
+            print(f"Error: --{option} no aplica {target}.")
+            sys.exit(1)
+    return handler
+
+
+def run_compile_catalogue(options, args):
+    """Subcomando: recompilar el caché aunque exista uno válido."""
+    for option in options:
+        if option != "catalogue-cache":
+            print(f"Error: --{option} no aplica con compile-catalogue.")
+            sys.exit(1)
+    if len(args) != 2:
+        print("Uso: python computeSales.py compile-catalogue priceCatalogue.json "
+              "[--catalogue-cache=ruta]")
+        sys.exit(1)
+    options.setdefault("catalogue-cache", True)
+    cache_path = _catalogue_cache_path(options, args[1])
+    catalogue = load_catalogue(args[1], cache_path, rebuild=True)
+    print(f"Catálogo compilado: {len(catalogue)} productos -> {cache_path}")
+
+
+def _print_usage():
+    """Imprime la ayuda de invocación."""
+    print("Uso: python computeSales.py priceCatalogue.json salesRecord.json")
+    print("     python computeSales.py [--workers=N] priceCatalogue.json "
+          "ventas1.json ventas2.json ...  (lote: total por archivo y general)")
+    print("     --aggregate: resumen por producto en lugar del detalle por fila")
+    print("     --group-by=date,sale,date-product: tablas por fecha, venta y/o "
+          "fecha+producto")
+    print("     --catalogue-cache[=ruta]: usar (o crear) el catálogo compilado; "
+          "recompilar con 'compile-catalogue'")
+    print("     --cents: sumar en centavos enteros (totales exactos)")
+    print("     --match=exact|normalized|fuzzy: productos sin coincidencia exacta "
+          "(por defecto normalized: mayúsculas y espacios)")
+
+
+def main():
+    """Punto de entrada. Uso: python computeSales.py priceCatalogue.json salesRecord.json"""
+    options, args = parse_options(sys.argv[1:])
+    if args and args[0] == "compile-catalogue":
+        run_compile_catalogue(options, args)
+        return
+    if len(args) < 2:
+        _print_usage()
+        sys.exit(1)
+
+    handler = select_mode(options, len(args) > 2)
+    run = SalesRun(options, args[0], args[1:])
+    try:
+        output_path, lines = handler(run)
+    except ValueError as err:
+        print(f"Error: JSON inválido en '{run.sales_paths[0]}': {err}")
+        sys.exit(1)
+    _write_lines(output_path, lines)
 
 
 if __name__ == "__main__":
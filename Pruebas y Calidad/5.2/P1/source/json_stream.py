@@ -0,0 +1,205 @@
+"""
+Lectura en streaming de listas JSON para Compute Sales - Actividad 5.2.
+
+El registro de ventas es una lista JSON que puede tener millones de filas;
+en lugar de json.load se decodifica un elemento a la vez sobre bloques de
+texto, así la memoria del parseo depende del tamaño de un elemento.
+"""
+
+import json
+import re
+
+# Caracteres leídos por bloque al recorrer el JSON de ventas en streaming
+SALES_READ_SIZE = 1 << 16
+
+# Espacios en blanco permitidos por JSON entre elementos
+JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# Caracteres al final de un bloque donde un error de raw_decode, o lo que
+# sigue a un número, puede deberse a un elemento cortado (p. ej. "-Infinity",
+# "1e+300" o un escape \uXXXX a medias)
+JSON_TRUNCATION_MARGIN = 16
+
+# Marca de elemento cortado por el bloque (ver _JsonBuffer.decode)
+_INCOMPLETE = object()
+
+
+class _JsonBuffer:
+    """
+    Ventana de texto sobre un archivo, leída por bloques.
+
+    text[pos:] es lo que falta por consumir; offset cuenta los caracteres
+    descartados antes de text, para reportar posiciones absolutas.
+    """
+
+    __slots__ = ("file", "read_size", "text", "pos", "offset", "eof")
+
+    def __init__(self, file, read_size):
+        self.file = file
+        self.read_size = read_size
+        self.text = file.read(read_size)
+        self.eof = not self.text
+        self.pos = 0
+        self.offset = 0
+
+    def where(self):
+        """Posición actual en caracteres desde el inicio del archivo."""
+        return self.offset + self.pos
+
+    def peek(self):
+        """Siguiente carácter que no es espacio ('' al final del archivo)."""
+        while True:
+            self.pos = JSON_WHITESPACE.match(self.text, self.pos).end()
+            if self.pos < len(self.text) or self.eof:
+                return self.text[self.pos:self.pos + 1]
+            self.offset += self.pos
+            self.text = self.file.read(self.read_size)
+            self.eof = not self.text
+            self.pos = 0
+
+    def extend(self):
+        """
+        Conserva text[pos:] y le agrega un bloque.
+
+        El bloque es al menos tan grande como lo conservado, así un elemento
+        largo se completa en O(n) y no en O(n²).
+        """
+        chunk = self.file.read(max(self.read_size, len(self.text)))
+        self.eof = not chunk
+        self.offset += self.pos
+        self.text = self.text[self.pos:] + chunk
+        self.pos = 0
+
+    def decode(self, decoder):
+        """
+        Decodifica el elemento en pos con raw_decode y avanza pos.
+
+        Returns:
+            El elemento, o _INCOMPLETE si puede estar cortado por el bloque.
+
+        Raises:
+            ValueError: Si el elemento es JSON inválido aunque se lea más.
+        """
+        text = self.text
+        try:
+            value, end = decoder.raw_decode(text, self.pos)
+        except json.JSONDecodeError as err:
+            # Solo un error al final del bloque (o una cadena sin cerrar)
+            # puede deberse a un corte; cualquier otro es definitivo
+            if (self.eof or (err.pos < len(text) - JSON_TRUNCATION_MARGIN
+                             and not err.msg.startswith("Unterminated string"))):
+                raise ValueError(f"{err.msg} (carácter {self.offset + err.pos})") from None
+            return _INCOMPLETE
+        # Un número al final del bloque puede estar cortado ("12" de "12.5",
+        # "1" de "1e+30"): se acepta si ya se ve el ',' o ']' siguiente, o si
+        # lo que sigue está lejos del final del bloque
+        after = JSON_WHITESPACE.match(text, end).end()
+        if (not self.eof and after >= len(text) - JSON_TRUNCATION_MARGIN
+                and text[after:after + 1] not in (",", "]")):
+            return _INCOMPLETE
+        self.pos = after
+        return value
+
+
+def _array_step(state, char, buffer):
+    """
+    Avanza la máquina de estados de la lista con un carácter estructural.
+
+    Estados: start -> first -> (value -> after)* -> end.
+
+    Returns:
+        El nuevo estado, o None si char inicia un elemento.
+
+    Raises:
+        ValueError: Si char no es válido en el estado actual.
+    """
+    if state == "start":
+        if char != "[":
+            raise ValueError(f"se esperaba una lista (carácter {buffer.where()})")
+        return "first"
+    if state == "end":
+        raise ValueError(f"datos extra después de la lista (carácter {buffer.where()})")
+    if char == "]" and state != "value":
+        return "end"
+    if state == "after":
+        if char != ",":
+            raise ValueError(f"se esperaba ',' o ']' (carácter {buffer.where()})")
+        return "value"
+    return None
+
+
+def iter_json_array(file, read_size=SALES_READ_SIZE):
+    """
+    Recorre en streaming un JSON cuyo nivel superior es una lista.
+
+    Lee bloques de read_size caracteres y decodifica un elemento a la vez con
+    json.JSONDecoder.raw_decode, descartando lo ya consumido: la memoria
+    depende del tamaño de un elemento, no del archivo. Un elemento inválido
+    se reporta en cuanto se ve completo, sin leer el resto del archivo.
+
+    Args:
+        file: Archivo de texto abierto.
+        read_size: Caracteres por lectura.
+
+    Yields:
+        Cada elemento de la lista, en orden.
+
+    Raises:
+        ValueError: Si el contenido no es una lista JSON válida (el mensaje
+            incluye la posición en caracteres desde el inicio del archivo).
+    """
+    decoder = json.JSONDecoder()
+    buffer = _JsonBuffer(file, read_size)
+    state = "start"
+    while True:
+        char = buffer.peek()
+        if state == "end" and not char:
+            return
+        next_state = _array_step(state, char, buffer)
+        if next_state is not None:
+            buffer.pos += 1
+            state = next_state
+            continue
+        value = buffer.decode(decoder)
+        if value is _INCOMPLETE:
+            buffer.extend()
+            continue
+        yield value
+        state = "after"
+        if buffer.text.startswith(",", buffer.pos):
+            # Caso común: la coma sigue al elemento en el mismo bloque
+            buffer.pos += 1
+            state = "value"
+
+
+def _iter_closing(file, read_size):
+    """Itera los elementos de la lista JSON y cierra el archivo al terminar."""
+    with file:
+        yield from iter_json_array(file, read_size)
+
+
+def stream_json_file(file_path, read_size=SALES_READ_SIZE):
+    """
+    Abre un archivo JSON con una lista para recorrerlo en streaming.
+
+    Args:
+        file_path: Ruta al archivo JSON.
+        read_size: Caracteres por lectura.
+
+    Returns:
+        Iterador de elementos (ver iter_json_array) o None si no se puede abrir.
+        Los errores de formato se reportan como ValueError al iterar.
+    """
+    try:
+        file = open(file_path, 'r', encoding='utf-8')  # pylint: disable=consider-using-with
+    except FileNotFoundError:
+        print(f"Error: Archivo no encontrado: '{file_path}'")
+        return None
+    except PermissionError:
+        print(f"Error: Sin permiso para leer: '{file_path}'")
+        return None
+    except OSError as err:
+        # Carpetas, dispositivos y otros errores de E/S
+        print(f"Error: No se pudo abrir '{file_path}': {err.strerror}")
+        return None
+    return _iter_closing(file, read_size)
@@ -0,0 +1,127 @@
+"""
+Coincidencia tolerante de productos para Compute Sales - Actividad 5.2.
+
+Un producto de ventas que no coincide exactamente con un título del
+catálogo se busca en un índice secundario normalizado (casefold y espacios
+colapsados) y, opcionalmente, por similitud de trigramas. Cada nombre
+desconocido distinto se resuelve una sola vez (memoizado), así el costo
+depende de los nombres distintos y no del número de filas.
+"""
+
+# Similitud mínima (Jaccard de trigramas) para aceptar una coincidencia aproximada
+FUZZY_THRESHOLD = 0.6
+
+# Candidatos (con más trigramas en común) a comparar por nombre desconocido
+MAX_FUZZY_CANDIDATES = 20
+
+# Marca de llave normalizada compartida por varios títulos (no se adivina)
+_AMBIGUOUS = object()
+
+
+def normalize_name(name):
+    """Casefold y espacios colapsados: '  Fresh  Stawberry ' -> 'fresh stawberry'."""
+    return " ".join(name.casefold().split())
+
+
+def trigrams(text):
+    """Conjunto de trigramas de text, con espacios de relleno en los extremos."""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TolerantCatalogue(dict):
+    """
+    Catálogo título -> precio cuyo get() también resuelve nombres aproximados.
+
+    Las búsquedas exactas siguen siendo un acceso al diccionario; solo los
+    nombres que fallan pasan por el índice normalizado y, con fuzzy, por los
+    trigramas. El resultado (título o None) se guarda en matches.
+    """
+
+    def __init__(self, catalogue, fuzzy=False):
+        """
+        Args:
+            catalogue: Dict título -> precio (float o centavos).
+            fuzzy: Buscar por trigramas si falla la llave normalizada.
+        """
+        super().__init__(catalogue)
+        self.fuzzy = fuzzy
+        self.normalized = {}
+        for title in catalogue:
+            key = normalize_name(title)
+            self.normalized[key] = _AMBIGUOUS if key in self.normalized else title
+        self.trigram_index = {}
+        if fuzzy:
+            for key, title in self.normalized.items():
+                if title is _AMBIGUOUS:
+                    continue
+                for trigram in trigrams(key):
+                    self.trigram_index.setdefault(trigram, []).append(key)
+        # Nombre desconocido -> (título del catálogo o None, método)
+        self.matches = {}
+
+    def resolve(self, name):
+        """
+        Título del catálogo al que corresponde name, o None.
+
+        Los nombres exactos se devuelven tal cual; los demás se resuelven una
+        sola vez y se avisa la primera vez que se toman como otro título.
+        """
+        if dict.__contains__(self, name):
+            return name
+        match = self.matches.get(name)
+        if match is None:
+            match = self.matches[name] = self._resolve(name)
+            if match[0] is not None:
+                print(f"Aviso: producto '{name}' se toma como '{match[0]}' ({match[1]}).")
+        return match[0]
+
+    def get(self, key, default=None):
+        """Precio del producto exacto o resuelto; default si no hay coincidencia."""
+        price = dict.get(self, key)
+        if price is not None:
+            return price
+        title = self.resolve(key)
+        return default if title is None else dict.__getitem__(self, title)
+
+    def __missing__(self, key):
+        """catalogue[nombre] también acepta nombres resueltos."""
+        price = self.get(key)
+        if price is None:
+            raise KeyError(key)
+        return price
+
+    def _resolve(self, name):
+        """Busca name por llave normalizada y luego por trigramas."""
+        key = normalize_name(name) if isinstance(name, str) else ""
+        title = self.normalized.get(key)
+        if title is _AMBIGUOUS:
+            return (None, "ambiguo")
+        if title is not None:
+            return (title, "normalizado")
+        if not self.fuzzy or not key:
+            return (None, "")
+        return self._resolve_fuzzy(key)
+
+    def _resolve_fuzzy(self, key):
+        """
+        Mejor título por similitud de trigramas (Jaccard), acotado a
+        MAX_FUZZY_CANDIDATES candidatos; None si hay empate o no alcanza
+        FUZZY_THRESHOLD.
+        """
+        query = trigrams(key)
+        shared = {}
+        for trigram in query:
+            for candidate in self.trigram_index.get(trigram, ()):
+                shared[candidate] = shared.get(candidate, 0) + 1
+        ranked = sorted(shared.items(), key=lambda item: -item[1])[:MAX_FUZZY_CANDIDATES]
+        scored = sorted(
+            ((common / (len(query) + len(trigrams(candidate)) - common), candidate)
+             for candidate, common in ranked),
+            reverse=True,
+        )
+        if not scored or scored[0][0] < FUZZY_THRESHOLD:
+            return (None, "")
+        if len(scored) > 1 and scored[1][0] == scored[0][0]:
+            return (None, "ambiguo")
+        return (self.normalized[scored[0][1]], f"aproximado {scored[0][0]:.2f}")